@@ -8,14 +8,21 @@
 # ----------------------------------------------------------------------
 
 # package imports
+import os
+import hashlib
 import numpy as np
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 from SUAVE.Analyses import Results
 import scipy.optimize as opt
+from scipy.interpolate import RegularGridInterpolator
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
-     import angles_to_dcms, orientation_product, orientation_transpose
+     import angles_to_dcms
+from SUAVE.Methods.Geometry.Three_Dimensional.thrust_axis_velocity import thrust_axis_velocity
+from SUAVE.Methods.Aerodynamics.Airfoil_Polars \
+     import import_airfoil_polars, compute_airfoil_polar_coefficients
+from SUAVE.Methods.Utilities.cache_folder import cache_folder
 
 from warnings import warn
 
@@ -34,6 +41,11 @@ class Propeller(Energy_Component):
         self.prop_attributes.twist_distribution = 0.0
         self.prop_attributes.chord_distribution = 0.0
         self.thrust_angle                       = 0.0
+        self.maximum_inflow_iterations          = 100
+        self.performance_map                    = None
+        self.airfoil_polars                     = None
+        self.airfoil_polar_stations             = None
+        self.acoustic_capture                   = 'always' # or 'final', see spin_acoustics
 
     def spin(self,conditions):
         """ Analyzes a propeller given geometry and operating conditions
@@ -58,6 +70,13 @@ class Propeller(Energy_Component):
 
            """
 
+        # Use the precomputed map if there is one, it has no station data for the noise methods
+        if self.performance_map is not None and self.acoustic_capture != 'always':
+            thrust, torque, power, Cp = self.spin_map(conditions)
+            thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
+            power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+            return thrust, torque, power, Cp
+
         #Unpack
         B      = self.prop_attributes.number_blades
         R      = self.prop_attributes.tip_radius
@@ -67,27 +86,13 @@ class Propeller(Energy_Component):
         omega1 = self.inputs.omega
         rho    = conditions.freestream.density[:,0,None]
         mu     = conditions.freestream.dynamic_viscosity[:,0,None]
-        Vv     = conditions.frames.inertial.velocity_vector
         a      = conditions.freestream.speed_of_sound[:,0,None]
         T      = conditions.freestream.temperature[:,0,None]
         theta  = self.thrust_angle
         tc     = .12 # Thickness to chord
 
-        BB     = B*B
-        BBB    = BB*B
-
-        # Velocity in the Body frame
-        T_body2inertial = conditions.frames.body.transform_to_inertial
-        T_inertial2body = orientation_transpose(T_body2inertial)
-        V_body = orientation_product(T_inertial2body,Vv)
-
-        # Velocity transformed to the propulsor frame
-        body2thrust   = np.array([[np.cos(theta), 0., np.sin(theta)],[0., 1., 0.], [-np.sin(theta), 0., np.cos(theta)]])
-        T_body2thrust = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
-        V_thrust      = orientation_product(T_body2thrust,V_body)
-
-        # Now just use the aligned velocity
-        V = V_thrust[:,0,None]
+        # Velocity along the propulsor axis
+        V = thrust_axis_velocity(conditions,theta)
 
         nu    = mu/rho
         tol   = 1e-6 # Convergence tolerance
@@ -107,7 +112,6 @@ class Propeller(Energy_Component):
         lamda   = V/(omega*R)              # Speed ratio
         r       = chi*R                    # Radial coordinate
         pi      = np.pi
-        pi2     = pi*pi
         x       = r*np.multiply(omega,1/V) # Nondimensional distance
         n       = omega/(2.*pi)            # Cycles per second
         J       = V/(2.*R*n)
@@ -126,97 +130,36 @@ class Propeller(Energy_Component):
         #Things that will change with iteration
         size = (len(a),N)
 
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
-
-        ii = 0
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
-
-            #if np.any(Ma> 1.0):
-                #warn('Propeller blade tips are supersonic.', Warning)
-
-            lamdaw = r*Wa/(R*Wt)
-
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-
-            # Estimate Cl max
-            Re         = (W*c)/nu
-            #Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            #Re_ref     = 9.*10**6
-            #Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = 2.*pi*alpha
-
-            # By 90 deg, it's totally stalled.
-            #Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp]
-            Cl[alpha>=pi/2] = 0.
-
-
-            ## Scale for Mach, this is Karmen_Tsien
-            #Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-
-            ## If the blade segments are supersonic, don't scale
-            #Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.]
-
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
-
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
-
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                print 'broke'
-                break
-
-        #There is also RE scaling
-        #This is an atrocious fit of DAE51 data at RE=50k for Cd
-        Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+        #Setup a Newton iteration, converged stations are frozen as they drop out
+        psi = np.ones(size)
+        sections = self.section_polars()
+        psi, converged, iterations = solve_inflow_angle(psi,Ua,Ut,U,beta,r,c,nu,B,R,tol,
+                                                        self.maximum_inflow_iterations,sections)
+
+        self.outputs.inflow_converged  = converged
+        self.outputs.inflow_iterations = iterations
+
+        # If its really not going to converge
+        if not np.all(converged):
+            warn('Propeller inflow angle did not converge at every station.', Warning)
+
+        # Blade element quantities at the converged inflow angle
+        element = blade_element_state(psi,Ua,Ut,U,beta,r,c,nu,B,R,sections)
+        Wa      = element.Wa
+        Wt      = element.Wt
+        alpha   = element.alpha
+        W       = element.W
+        Gamma   = element.Gamma
+        Cl      = element.Cl
+        Re      = element.Re
+        Ma      = (W)/a #a is the speed of sound
+
+        if sections is None:
+            #There is also RE scaling
+            #This is an atrocious fit of DAE51 data at RE=50k for Cd
+            Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+        else:
+            Cdval = element.Cd
         Cdval[alpha>=pi/2] = 2.
 
         #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
@@ -246,26 +189,9 @@ class Propeller(Energy_Component):
 
         conditions.propulsion.etap = etap
 
-        # calculating Activity Factor (per blade)
-        #AF = 100000./16. * np.trapz((c/D) * (r/R)**3, x=r/R)
-        AF = (10./D)**5. * np.trapz(c * r**3, x=r)         
-
-        # store data
-        results_conditions = Results
-        conditions.propulsion.acoustic_outputs = results_conditions(
-            number_sections = N,
-            r0 = r,
-            airfoil_chord = c,
-            blades_number = B,
-            propeller_diameter = D,
-            drag_coefficient = Cd,
-            lift_coefficient = Cl,
-            rpm = omega,
-            velocity = V,
-            thrust = thrust,
-            hp = power,
-            blade_activity_factor = AF,
-        )
+        # the noise methods are the only users of the station data
+        if self.acoustic_capture == 'always':
+            conditions.propulsion.acoustic_outputs = acoustic_outputs(r,c,B,D,Cd,Cl,omega,V,thrust,power)
 
 
         return thrust, torque, power, Cp
@@ -295,6 +221,10 @@ class Propeller(Energy_Component):
 
            """
 
+        # Use the precomputed map if there is one, it has no station data for the noise methods
+        if self.performance_map is not None and self.acoustic_capture != 'always':
+            return self.spin_map(conditions,conditions.propulsion.pitch_command)
+
         #Unpack
         B       = self.prop_attributes.number_blades
         R       = self.prop_attributes.tip_radius
@@ -304,7 +234,6 @@ class Propeller(Energy_Component):
         omega1  = self.inputs.omega
         rho     = conditions.freestream.density[:,0,None]
         mu      = conditions.freestream.dynamic_viscosity[:,0,None]
-        Vv      = conditions.frames.inertial.velocity_vector
         a       = conditions.freestream.speed_of_sound[:,0,None]
         T       = conditions.freestream.temperature[:,0,None]
         theta   = self.thrust_angle
@@ -313,21 +242,8 @@ class Propeller(Energy_Component):
 
         beta   = beta_in + beta_c
 
-        BB     = B*B
-        BBB    = BB*B
-
-        # Velocity in the Body frame
-        T_body2inertial = conditions.frames.body.transform_to_inertial
-        T_inertial2body = orientation_transpose(T_body2inertial)
-        V_body = orientation_product(T_inertial2body,Vv)
-
-        # Velocity transformed to the propulsor frame
-        body2thrust   = np.array([[np.cos(theta), 0., np.sin(theta)],[0., 1., 0.], [-np.sin(theta), 0., np.cos(theta)]])
-        T_body2thrust = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
-        V_thrust      = orientation_product(T_body2thrust,V_body)
-
-        # Now just use the aligned velocity
-        V = V_thrust[:,0,None]
+        # Velocity along the propulsor axis
+        V = thrust_axis_velocity(conditions,theta)
 
         nu    = mu/rho
         tol   = 1e-6 # Convergence tolerance
@@ -347,7 +263,6 @@ class Propeller(Energy_Component):
         lamda   = V/(omega*R)              # Speed ratio
         r       = chi*R                    # Radial coordinate
         pi      = np.pi
-        pi2     = pi*pi
         x       = r*np.multiply(omega,1/V) # Nondimensional distance
         n       = omega/(2.*pi)            # Cycles per second
         J       = V/(2.*R*n)
@@ -366,92 +281,36 @@ class Propeller(Energy_Component):
         #Things that will change with iteration
         size = (len(a),N)
 
-        #Setup a Newton iteration
-        psi    = np.ones(size)*0.5
-        psiold = np.zeros(size)
-        diff   = 1.
-
-        ii = 0
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
-
-            #if np.any(Ma> 1.0):
-                #warn('Propeller blade tips are supersonic.', Warning)
-
-            lamdaw = r*Wa/(R*Wt)
-
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-
-            # Estimate Cl max
-            Re         = (W*c)/nu
-            #Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            #Re_ref     = 9.*10**6
-            #Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = 2.*pi*alpha
-
-            # By 90 deg, it's totally stalled.
-            #Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp]
-            Cl[alpha>=pi/2] = 0.
-
-
-            ## Scale for Mach, this is Karmen_Tsien
-            #Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-
-            ## If the blade segments are supersonic, don't scale
-            #Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.]
-
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
-
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
-
-        #There is also RE scaling
-        #This is an atrocious fit of DAE51 data at RE=50k for Cd
-        Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+        #Setup a Newton iteration, converged stations are frozen as they drop out
+        psi = np.ones(size)*0.5
+        sections = self.section_polars()
+        psi, converged, iterations = solve_inflow_angle(psi,Ua,Ut,U,beta,r,c,nu,B,R,tol,
+                                                        self.maximum_inflow_iterations,sections)
+
+        self.outputs.inflow_converged  = converged
+        self.outputs.inflow_iterations = iterations
+
+        # If its really not going to converge
+        if not np.all(converged):
+            warn('Propeller inflow angle did not converge at every station.', Warning)
+
+        # Blade element quantities at the converged inflow angle
+        element = blade_element_state(psi,Ua,Ut,U,beta,r,c,nu,B,R,sections)
+        Wa      = element.Wa
+        Wt      = element.Wt
+        alpha   = element.alpha
+        W       = element.W
+        Gamma   = element.Gamma
+        Cl      = element.Cl
+        Re      = element.Re
+        Ma      = (W)/a #a is the speed of sound
+
+        if sections is None:
+            #There is also RE scaling
+            #This is an atrocious fit of DAE51 data at RE=50k for Cd
+            Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+        else:
+            Cdval = element.Cd
         Cdval[alpha>=pi/2] = 2.
 
         #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
@@ -478,26 +337,659 @@ class Propeller(Energy_Component):
 
         conditions.propulsion.etap = etap
         
-        # calculating Activity Factor (per blade)
-        #AF = 100000./16. * np.trapz((c/D) * (r/R)**3, x=r/R)
-        AF = (10./D)**5. * np.trapz(c * r**3, x=r)        
-
-        # store data
-        results_conditions = Results
-        conditions.propulsion.acoustic_outputs = results_conditions(
-            number_sections = N,
-            r0 = r,
-            airfoil_chord = c,
-            blades_number = B,
-            propeller_diameter = D,
-            drag_coefficient = Cd,
-            lift_coefficient = Cl,
-            rpm = omega,
-            velocity = V,
-            thrust = thrust,
-            hp = power,
-            blade_activity_factor = AF,
-        )
-
-
-        return thrust, torque, power, Cp
\ No newline at end of file
+        # the noise methods are the only users of the station data
+        if self.acoustic_capture == 'always':
+            conditions.propulsion.acoustic_outputs = acoustic_outputs(r,c,B,D,Cd,Cl,omega,V,thrust,power)
+
+
+        return thrust, torque, power, Cp
+
+
+    def spin_acoustics(self,conditions,variable_pitch=False):
+        """ Final blade element pass that stores conditions.propulsion.acoustic_outputs
+
+                 Inputs:
+                     conditions     - converged conditions, same as spin
+                     variable_pitch - use spin_variable_pitch instead of spin
+
+                 Outputs:
+                     thrust, torque, power, Cp - same as spin
+
+                 Assumptions:
+                     With acoustic_capture = 'final' the residual evaluations skip
+                     the acoustic outputs, and this is called once on the converged
+                     segment by Common.Propeller_Acoustics.update_propeller_acoustics.
+                     The performance map is bypassed since the noise methods need
+                     the station data. Only the acoustic outputs are left in the
+                     conditions, the efficiency of the converged pass is kept.
+           """
+
+        capture         = self.acoustic_capture
+        performance_map = self.performance_map
+        etap            = conditions.propulsion.get('etap',None)
+
+        self.acoustic_capture = 'always'
+        self.performance_map  = None
+
+        try:
+            if variable_pitch:
+                results = self.spin_variable_pitch(conditions)
+            else:
+                results = self.spin(conditions)
+        finally:
+            self.acoustic_capture = capture
+            self.performance_map  = performance_map
+            if etap is not None:
+                conditions.propulsion.etap = etap
+
+        return results
+
+
+    def solve_pitch(self,conditions,target,quantity='power',pitch_bounds=(-0.25,0.5),tol=1e-4,max_iterations=30):
+        """ Finds the pitch_command giving a target power or thrust at every control point
+
+                 Inputs:
+                     conditions     - same as spin_variable_pitch
+                     target         - power [W] or thrust [N], scalar or one per control point
+                     quantity       - 'power' or 'thrust'
+                     pitch_bounds   - lower and upper pitch_command [radians]
+                     tol            - tolerance relative to the target
+                     max_iterations - hard iteration budget
+
+                 Outputs:
+                     pitch_command - (control points x 1), also left in conditions.propulsion
+                     converged     - (control points x 1) boolean flags
+
+                 Assumptions:
+                     Power and thrust are monotonic in pitch inside the bounds.
+                     All control points are solved together with a safeguarded
+                     regula falsi (Illinois) iteration that falls back to bisection,
+                     so each iteration is one call to spin_variable_pitch.
+                     Points whose target is not bracketed are left at the closer bound.
+
+                     This is a helper for the energy networks, nothing calls it
+                     yet. A network that calls it in evaluate_thrust with the
+                     power its motor delivers can drop pitch_command from the
+                     segment unknowns and residuals.
+           """
+
+        index  = {'thrust':0,'power':2}[quantity]
+        rows   = conditions.freestream.density.shape[0]
+        target = np.broadcast_to(np.reshape(target,(-1,1)),(rows,1))*1.
+        ones   = np.ones_like(target)
+
+        propulsion = conditions.propulsion
+
+        def residual(pitch):
+            propulsion.pitch_command = pitch
+            return self.spin_variable_pitch(conditions)[index] - target
+
+        lo   = ones*pitch_bounds[0]
+        hi   = ones*pitch_bounds[1]
+        f_lo = residual(lo)
+        f_hi = residual(hi)
+
+        # points that cannot reach the target sit at the closer bound
+        pitch     = np.where(np.abs(f_lo)<np.abs(f_hi),lo,hi)
+        scale     = np.maximum(np.abs(target),1.)
+        converged = np.zeros(target.shape,dtype=bool)
+        active    = (f_lo*f_hi <= 0.)
+        side      = np.zeros(target.shape,dtype=int)
+
+        for ii in range(max_iterations):
+
+            if not np.any(active):
+                break
+
+            # secant through the bracket, bisect where that is unusable
+            with np.errstate(divide='ignore',invalid='ignore'):
+                step = hi - f_hi*(hi-lo)/(f_hi-f_lo)
+            unusable       = ~np.isfinite(step) | (step<=lo) | (step>=hi)
+            step[unusable] = 0.5*(lo+hi)[unusable]
+
+            pitch[active] = step[active]
+            f = residual(pitch)
+
+            done       = active & (np.abs(f) <= tol*scale)
+            converged |= done
+            active     = active & ~done
+
+            # shrink the brackets, halving a stale end as in the Illinois method
+            left  = active & (f*f_lo > 0.)
+            right = active & ~left
+
+            f_hi[left  & (side== 1)] *= 0.5
+            f_lo[right & (side==-1)] *= 0.5
+
+            lo[left]    = pitch[left]
+            f_lo[left]  = f[left]
+            hi[right]   = pitch[right]
+            f_hi[right] = f[right]
+
+            side[left]  = 1
+            side[right] = -1
+
+        # leave the propeller state consistent with the returned pitch
+        propulsion.pitch_command = pitch
+        self.spin_variable_pitch(conditions)
+
+        return pitch, converged
+
+
+    def section_polars(self):
+        """ Imported airfoil polar tables and the airfoil index of each station,
+            or None when no polars are given and the 2 pi alpha model is used
+        """
+
+        if self.airfoil_polars is None:
+            return None
+
+        stations = self.airfoil_polar_stations
+        if stations is None:
+            stations = np.zeros(len(self.prop_attributes.chord_distribution))
+
+        # the tables are parsed once per process, and picked again only when
+        # the polar files or the stations change
+        key = (tuple(tuple(polar_files) for polar_files in self.airfoil_polars),
+               tuple(np.ravel(stations).astype(int)))
+
+        if self.get('section_polar_key',None) != key:
+            sections = Data()
+            sections.tables   = [import_airfoil_polars(polar_files) for polar_files in self.airfoil_polars]
+            sections.stations = np.array(stations,dtype=int)
+
+            self.section_polar_data = sections
+            self.section_polar_key  = key
+
+        return self.section_polar_data
+
+
+    def build_performance_map(self,advance_ratio,tip_mach,reynolds_number,pitch_command,folder=None,save=True):
+        """ Tabulates CT, CP and efficiency of this blade with spin_variable_pitch
+
+                 Inputs:
+                     advance_ratio   - 1D array of J = V/(nD)
+                     tip_mach        - 1D array of omega*R/a
+                     reynolds_number - 1D array of omega*R*(mean chord)/nu
+                     pitch_command   - 1D array of pitch offsets [radians]
+                     folder          - where maps are saved, defaults to the
+                                       'propeller_maps' cache folder
+                     save            - False to neither load nor save the map
+
+                 Outputs:
+                     performance map, also stored in self.performance_map
+
+                 Assumptions:
+                     Sea level standard density and temperature are used to
+                     build the table, so the temperature dependence of the
+                     drag scaling is frozen at the reference value.
+                     The map is saved keyed by a hash of the blade geometry, the
+                     section polars and the grid, and reloaded instead of rebuilt
+                     when it exists.
+                     spin only uses the map with acoustic_capture = 'final'.
+           """
+
+        advance_ratio   = np.array(advance_ratio,dtype=float)
+        tip_mach        = np.array(tip_mach,dtype=float)
+        reynolds_number = np.array(reynolds_number,dtype=float)
+        pitch_command   = np.array(pitch_command,dtype=float)
+        axes            = [advance_ratio,tip_mach,reynolds_number,pitch_command]
+
+        # look for a saved map first
+        key      = self.geometry_hash(axes)
+        filename = None
+        if save:
+            if folder is None:
+                folder = cache_folder('propeller_maps')
+            filename = os.path.join(folder,'propeller_map_' + key + '.npz')
+            if os.path.exists(filename):
+                self.performance_map = load_performance_map(filename)
+                return self.performance_map
+
+        #Unpack
+        R    = self.prop_attributes.tip_radius
+        c    = self.prop_attributes.chord_distribution
+        D    = 2.*R
+        cbar = np.mean(c)
+
+        # reference atmosphere
+        rho = 1.225
+        T   = 288.15
+        a   = 340.294
+
+        # one row per grid point, all evaluated in a single call
+        grid = np.meshgrid(advance_ratio,tip_mach,reynolds_number,pitch_command,indexing='ij')
+        J, Mt, Re, beta_c = [g.reshape(-1,1) for g in grid]
+        rows  = J.shape[0]
+        ones  = np.ones((rows,1))
+
+        omega = Mt*a/R
+        n     = omega/(2.*np.pi)
+        V     = J*n*D
+        nu    = omega*R*cbar/Re
+
+        konditions = Data()
+        konditions.freestream = Data()
+        konditions.freestream.density           = rho*ones
+        konditions.freestream.dynamic_viscosity = rho*nu
+        konditions.freestream.speed_of_sound    = a*ones
+        konditions.freestream.temperature       = T*ones
+        konditions.frames = Data()
+        konditions.frames.inertial = Data()
+        konditions.frames.inertial.velocity_vector = np.hstack([V,0.*ones,0.*ones])
+        konditions.frames.body = Data()
+        konditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(rows,1,1))
+        konditions.propulsion = Data()
+        konditions.propulsion.pitch_command = beta_c
+
+        # run the blade element analysis without disturbing the live state
+        omega_live           = self.inputs.omega
+        thrust_angle         = self.thrust_angle
+        map_live             = self.performance_map
+        self.inputs.omega    = omega
+        self.thrust_angle    = 0.0
+        self.performance_map = None
+        try:
+            thrust, torque, power, Cp = self.spin_variable_pitch(konditions)
+        finally:
+            self.inputs.omega    = omega_live
+            self.thrust_angle    = thrust_angle
+            self.performance_map = map_live
+
+        shape = grid[0].shape
+        CT    = (thrust/(rho*n*n*D**4)).reshape(shape)
+        CP    = (power/(rho*n*n*n*D**5)).reshape(shape)
+        etap  = J.reshape(shape)*CT/CP
+
+        # pack
+        performance_map = Data()
+        performance_map.geometry_hash      = key
+        performance_map.mean_chord         = cbar
+        performance_map.advance_ratio      = advance_ratio
+        performance_map.tip_mach           = tip_mach
+        performance_map.reynolds_number    = reynolds_number
+        performance_map.pitch_command      = pitch_command
+        performance_map.thrust_coefficient = CT
+        performance_map.power_coefficient  = CP
+        performance_map.efficiency         = etap
+        performance_map.interpolator       = performance_map_interpolator(performance_map)
+
+        if filename is not None:
+            save_performance_map(performance_map,filename)
+
+        self.performance_map = performance_map
+
+        return performance_map
+
+
+    def spin_map(self,conditions,pitch_command=0.0):
+        """ Evaluates the propeller from its precomputed performance map
+
+                 Inputs:
+                     same conditions and inputs as spin
+                     pitch_command - pitch offset per control point [radians]
+
+                 Outputs:
+                     thrust, torque, power, Cp - same as spin
+
+                 Assumptions:
+                     Multilinear interpolation in (J, tip Mach, log Re, pitch).
+                     Points outside the table are held to the nearest edge.
+                     No blade station data is available, so acoustic outputs
+                     are not produced. spin and spin_variable_pitch only use the
+                     map with acoustic_capture = 'final', and fall back to the
+                     blade element analysis with 'always'. Calling this directly
+                     with 'always' is an error.
+           """
+
+        if self.acoustic_capture == 'always':
+            raise ValueError("spin_map gives no acoustic outputs, set acoustic_capture to 'final'")
+
+        #Unpack
+        pmap   = self.performance_map
+        R      = self.prop_attributes.tip_radius
+        omega1 = self.inputs.omega
+        rho    = conditions.freestream.density[:,0,None]
+        mu     = conditions.freestream.dynamic_viscosity[:,0,None]
+        a      = conditions.freestream.speed_of_sound[:,0,None]
+        theta  = self.thrust_angle
+
+        # Velocity along the propulsor axis
+        V = thrust_axis_velocity(conditions,theta)
+
+        omega = np.abs(omega1*1.0)
+        D     = 2.*R
+        n     = omega/(2.*np.pi)
+        nu    = mu/rho
+
+        # map coordinates
+        J     = V/(n*D)
+        Mt    = omega*R/a
+        Re    = omega*R*pmap.mean_chord/nu
+        pitch = np.ones_like(J)*pitch_command
+
+        CT, CP = evaluate_performance_map(pmap,J,Mt,Re,pitch)
+
+        thrust = CT*rho*n*n*D**4
+        power  = CP*rho*n*n*n*D**5
+        torque = power/omega
+        Cp     = CP
+
+        thrust[omega1<0.0] = - thrust[omega1<0.0]
+
+        etap     = V*thrust/power
+
+        conditions.propulsion.etap = etap
+
+        return thrust, torque, power, Cp
+
+
+    def geometry_hash(self,*args):
+        """ Hash of the blade geometry, the section polar files and stations,
+            plus any extra arrays, used to key saved maps
+        """
+
+        attributes = self.prop_attributes
+
+        sha = hashlib.sha1()
+        for value in [attributes.number_blades,attributes.tip_radius,attributes.hub_radius,
+                      attributes.twist_distribution,attributes.chord_distribution]:
+            sha.update(np.ascontiguousarray(value,dtype=float).tobytes())
+
+        # the polars change Cl and Cd, so their contents are part of the key
+        if self.airfoil_polars is not None:
+            for polar_files in self.airfoil_polars:
+                for polar_file in polar_files:
+                    with open(polar_file,'rb') as f:
+                        sha.update(f.read())
+            if self.airfoil_polar_stations is not None:
+                sha.update(np.ascontiguousarray(self.airfoil_polar_stations,dtype=float).tobytes())
+
+        for extra in args:
+            for value in extra:
+                sha.update(np.ascontiguousarray(value,dtype=float).tobytes())
+
+        return sha.hexdigest()
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def blade_element_state(psi,Ua,Ut,U,beta,r,c,nu,B,R,sections=None):
+    """ Blade element velocities, circulation and section coefficients for a
+        given inflow angle psi. The remaining inputs only need to broadcast
+        against psi. Sections carries the polar tables of section_polars; without
+        them lift is 2 pi alpha and no drag coefficient is returned.
+    """
+
+    pi = np.pi
+
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi
+    #va     = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+
+    lamdaw = r*Wa/(R*Wt)
+
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+
+    # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+    Re = (W*c)/nu
+    if sections is None:
+        Cl = 2.*pi*alpha
+        Cd = None
+    else:
+        Cl, Cd = compute_airfoil_polar_coefficients(sections.tables,sections.stations,alpha,Re)
+
+    # By 90 deg, it's totally stalled.
+    Cl[alpha>=pi/2] = 0.
+
+    state = Data()
+    state.sin_psi      = sin_psi
+    state.cos_psi      = cos_psi
+    state.Wa           = Wa
+    state.Wt           = Wt
+    state.alpha        = alpha
+    state.W            = W
+    state.piece        = piece
+    state.arccos_piece = arccos_piece
+    state.Gamma        = Gamma
+    state.Re           = Re
+    state.Cl           = Cl
+    state.Cd           = Cd
+
+    return state
+
+
+def inflow_residual(psi,Ua,Ut,U,beta,r,c,nu,B,R,sections=None):
+    """ Residual of the circulation balance and its analytical derivative
+        with respect to the inflow angle psi. The derivative assumes 2 pi alpha
+        lift, with tabulated polars it becomes a quasi-Newton step.
+    """
+
+    pi  = np.pi
+    pi2 = pi*pi
+    BB  = B*B
+    BBB = BB*B
+
+    state        = blade_element_state(psi,Ua,Ut,U,beta,r,c,nu,B,R,sections)
+    sin_psi      = state.sin_psi
+    cos_psi      = state.cos_psi
+    Wa           = state.Wa
+    Wt           = state.Wt
+    piece        = state.piece
+    arccos_piece = state.arccos_piece
+
+    Rsquiggly = state.Gamma - 0.5*state.W*c*state.Cl
+
+    #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+    #This was solved symbolically in Matlab and exported
+    f_wt_2 = 4*Wt*Wt
+    f_wa_2 = 4*Wa*Wa
+    Ucospsi  = U*cos_psi
+    Usinpsi  = U*sin_psi
+    Utcospsi = Ut*cos_psi
+    Uasinpsi = Ua*sin_psi
+
+    UapUsinpsi = (Ua + Usinpsi)
+    utpUcospsi = (Ut + Ucospsi)
+
+    utpUcospsi2 = utpUcospsi*utpUcospsi
+    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+
+    dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
+               (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+               + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+               - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
+              (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
+               r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
+               Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
+
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+
+    return Rsquiggly, dR_dpsi
+
+
+def solve_inflow_angle(psi,Ua,Ut,U,beta,r,c,nu,B,R,tol=1e-6,max_iterations=100,sections=None):
+    """ Batched Newton solve of the inflow angle at every (control point, station) entry
+
+        Inputs:
+            psi            - initial guess, (control points x stations)
+            Ua, Ut, U, beta, r, c, nu - blade element inputs, broadcastable against psi
+            B, R           - number of blades, tip radius
+            tol            - convergence tolerance on the Newton step
+            max_iterations - hard iteration budget
+            sections       - airfoil polar tables, see Propeller.section_polars
+
+        Outputs:
+            psi        - inflow angle, same shape as the initial guess
+            converged  - boolean flag per entry
+            iterations - number of Newton steps taken per entry
+
+        Assumptions:
+            Entries are independent, so converged entries are frozen and
+            only the active subset is carried through each iteration.
+            Entries heading past 85 deg are dropped as unconverged.
+    """
+
+    shape = np.shape(psi)
+    psi   = np.array(psi,dtype=float).ravel()
+
+    # flatten everything to one entry per (control point, station)
+    Ua   = np.broadcast_to(Ua,shape).ravel()
+    Ut   = np.broadcast_to(Ut,shape).ravel()
+    U    = np.broadcast_to(U,shape).ravel()
+    beta = np.broadcast_to(beta,shape).ravel()
+    r    = np.broadcast_to(r,shape).ravel()
+    c    = np.broadcast_to(c,shape).ravel()
+    nu   = np.broadcast_to(nu,shape).ravel()
+
+    if sections is not None:
+        stations = np.broadcast_to(sections.stations,shape).ravel()
+
+    psi_max    = np.pi*85.0/180.
+    converged  = np.zeros(psi.size,dtype=bool)
+    iterations = np.zeros(psi.size,dtype=int)
+    active     = np.arange(psi.size)
+
+    for ii in range(max_iterations):
+
+        if sections is not None:
+            subset = Data()
+            subset.tables   = sections.tables
+            subset.stations = stations[active]
+        else:
+            subset = None
+
+        Rsquiggly, dR_dpsi = inflow_residual(psi[active],Ua[active],Ut[active],U[active],
+                                             beta[active],r[active],c[active],nu[active],B,R,subset)
+
+        dpsi = -Rsquiggly/dR_dpsi
+        psi[active]        += dpsi
+        iterations[active] += 1
+
+        # freeze what has converged, drop what is running away
+        done     = np.abs(dpsi) <= tol
+        diverged = (psi[active]>psi_max) & (dpsi>0.0)
+
+        converged[active[done]] = True
+        active = active[~(done | diverged)]
+
+        if active.size == 0:
+            break
+
+    return psi.reshape(shape), converged.reshape(shape), iterations.reshape(shape)
+
+
+def acoustic_outputs(r,c,B,D,Cd,Cl,omega,V,thrust,power):
+    """ Blade station data read by the noise methods
+    """
+
+    # calculating Activity Factor (per blade)
+    #AF = 100000./16. * np.trapz((c/D) * (r/R)**3, x=r/R)
+    AF = (10./D)**5. * np.trapz(c * r**3, x=r)
+
+    # store data
+    results_conditions = Results
+    outputs = results_conditions(
+        number_sections = len(c),
+        r0 = r,
+        airfoil_chord = c,
+        blades_number = B,
+        propeller_diameter = D,
+        drag_coefficient = Cd,
+        lift_coefficient = Cl,
+        rpm = omega,
+        velocity = V,
+        thrust = thrust,
+        hp = power,
+        blade_activity_factor = AF,
+    )
+
+    return outputs
+
+
+def performance_map_interpolator(performance_map):
+    """ Multilinear interpolant over (J, tip Mach, log10 Re, pitch) returning [CT, CP]
+    """
+
+    axes   = (performance_map.advance_ratio,
+              performance_map.tip_mach,
+              np.log10(performance_map.reynolds_number),
+              performance_map.pitch_command)
+    values = np.stack([performance_map.thrust_coefficient,performance_map.power_coefficient],axis=-1)
+
+    return RegularGridInterpolator(axes,values,method='linear')
+
+
+def evaluate_performance_map(performance_map,J,Mt,Re,pitch):
+    """ Vectorized lookup of CT and CP for column arrays of operating points
+    """
+
+    points = np.hstack([J,Mt,np.log10(Re),pitch])
+
+    # hold to the edges of the table
+    lower  = [performance_map.advance_ratio[0],performance_map.tip_mach[0],
+              np.log10(performance_map.reynolds_number[0]),performance_map.pitch_command[0]]
+    upper  = [performance_map.advance_ratio[-1],performance_map.tip_mach[-1],
+              np.log10(performance_map.reynolds_number[-1]),performance_map.pitch_command[-1]]
+    points = np.clip(points,lower,upper)
+
+    values = performance_map.interpolator(points)
+
+    return values[:,0,None], values[:,1,None]
+
+
+def save_performance_map(performance_map,filename):
+    """ Writes a performance map to a compressed numpy archive
+    """
+
+    folder = os.path.dirname(filename)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+
+    np.savez_compressed(filename,
+                        geometry_hash      = performance_map.geometry_hash,
+                        mean_chord         = performance_map.mean_chord,
+                        advance_ratio      = performance_map.advance_ratio,
+                        tip_mach           = performance_map.tip_mach,
+                        reynolds_number    = performance_map.reynolds_number,
+                        pitch_command      = performance_map.pitch_command,
+                        thrust_coefficient = performance_map.thrust_coefficient,
+                        power_coefficient  = performance_map.power_coefficient,
+                        efficiency         = performance_map.efficiency)
+
+    return
+
+
+def load_performance_map(filename):
+    """ Reads a performance map written by save_performance_map
+    """
+
+    archive = np.load(filename)
+
+    performance_map = Data()
+    performance_map.geometry_hash      = str(archive['geometry_hash'])
+    performance_map.mean_chord         = float(archive['mean_chord'])
+    performance_map.advance_ratio      = archive['advance_ratio']
+    performance_map.tip_mach           = archive['tip_mach']
+    performance_map.reynolds_number    = archive['reynolds_number']
+    performance_map.pitch_command      = archive['pitch_command']
+    performance_map.thrust_coefficient = archive['thrust_coefficient']
+    performance_map.power_coefficient  = archive['power_coefficient']
+    performance_map.efficiency         = archive['efficiency']
+    performance_map.interpolator       = performance_map_interpolator(performance_map)
+
+    return performance_map
@@ -47,6 +47,9 @@ modules = [
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/propeller/propeller.py',
     'scripts/aerodynamics/aerodynamics.py',
+    'scripts/aerodynamics/avl_parallel.py',
+    'scripts/aerodynamics/vortex_lattice.py',
+    'scripts/segment_jacobian/segment_jacobian.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
     'scripts/battery/battery.py',
     'scripts/cmalpha/cmalpha.py',
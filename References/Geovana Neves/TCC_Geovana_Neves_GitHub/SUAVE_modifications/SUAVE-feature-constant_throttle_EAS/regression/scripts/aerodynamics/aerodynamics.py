@@ -98,6 +98,11 @@ def main():
     #call the aero model        
     results = aerodynamics.evaluate(state)
     
+    #every call returns results of its own
+    results_again = aerodynamics.evaluate(state)
+    assert( results_again is not results )
+    assert( results_again.lift is not results.lift )
+    
     #build a polar for the markup aero
     polar = Data()    
     CL = results.lift.total
@@ -115,9 +120,9 @@ def main():
     #compute_aircraft_lift(conditions, configuration, geometry) 
     
     lift = state.conditions.aerodynamics.lift_coefficient
-    lift_r = np.array([-2.42489437, -0.90696416, -0.53991953, -0.3044834 ,  -0.03710598,
-                       0.31061936 ,  0.52106899,  0.77407765,  1.22389024,  1.86240501,
-                       1.54587835])[:,None]
+    lift_r = np.array([-2.00528339, -0.8748128 , -0.54199476, -0.2986022 , -0.03567014,
+                        0.28314553,  0.5152153 ,  0.77103591,  1.1529064 ,  1.6277987 ,
+                        1.53931285])[:,None]
     
     lift_test = np.abs((lift-lift_r)/lift)
     
@@ -175,13 +180,13 @@ def main():
       
 
 def reg_values():
-    cd_c_r = np.array([  2.08459463e-09,   1.08648911e-09,   4.40666169e-23,   1.88258599e-09,
-                         3.71806409e-04,   6.07658788e-05,   2.38156998e-09,   4.35875057e-11,
-                         7.93890380e-05,   2.19714380e-03,   6.81119259e-14])
+    cd_c_r = np.array([  2.11718977e-08,   1.31179880e-09,   4.35501078e-23,   1.94375362e-09,
+                         3.74496380e-04,   5.40784141e-05,   2.33245585e-09,   4.32424339e-11,
+                         7.51097789e-05,   3.35701487e-03,   6.85111608e-14])
     
-    cd_i_r = np.array([  2.37792323e-01,     3.36989611e-02,       1.29763962e-02,     3.78292450e-03,
-                         5.68310476e-05,     3.85710691e-03,       1.11551856e-02,     2.55851168e-02,
-                         6.14241594e-02,     1.40294860e-01,       9.83364067e-02])
+    cd_i_r = np.array([  1.62616157e-01,     3.13520918e-02,       1.30763399e-02,     3.63819892e-03,
+                         5.25179138e-05,     3.20497066e-03,       1.09059588e-02,     2.53844385e-02,
+                         5.45057573e-02,     1.07175346e-01,       9.75028914e-02])
                         
                         
                         
@@ -216,9 +221,9 @@ def reg_values():
                                  0.0048708 ,  0.00579879,  0.00734795,  0.00582637,  0.0054087,
                                  0.00583051])
     
-    cd_tot_r        = np.array([ 0.2595146 ,  0.05226547,  0.04064861,  0.02131243,
-                                 0.01927301,  0.01923316,  0.02958776,  0.048638,
-                                 0.08073247,  0.16186261,  0.11868474])
+    cd_tot_r        = np.array([ 0.18283493,  0.04987166,  0.04075055,  0.02116481,
+                                 0.01927135,  0.01856116,  0.02933355,  0.04843331,
+                                 0.07367134,  0.12926377,  0.11783455])
     
     
     
@@ -0,0 +1,177 @@
+# avl_parallel.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics import Aerodynamics as Aero_Conditions
+from SUAVE.Analyses.Aerodynamics.AVL_Cache import AVL_Cache
+from SUAVE.Methods.Utilities.cache_folder import cache_folder
+
+from mission_B737 import vehicle_setup
+
+import os
+import copy
+import tempfile
+import numpy as np
+from shutil import rmtree
+
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # AVL itself is replaced by a script writing canned result files,
+    # CL = 0.2 + 0.1*alpha [deg] and Cm = -0.05*CL
+    avl_bin_name = os.path.abspath('stand_in_avl.py')
+    run_folder   = 'avl_parallel_files'
+
+    vehicle = vehicle_setup()
+
+    # two analyses on the same settings, one serial and one on two workers
+    avl_serial   = avl_setup(vehicle,avl_bin_name,run_folder,1)
+    avl_parallel = avl_setup(vehicle,avl_bin_name,run_folder,2)
+
+    # each analysis runs in its own folder
+    serial_folder   = avl_serial.current_status.run_folder
+    parallel_folder = avl_parallel.current_status.run_folder
+    assert( serial_folder != parallel_folder )
+    assert( os.path.exists(serial_folder) and os.path.exists(parallel_folder) )
+
+    # run cases, more than there are workers
+    alpha      = np.linspace(-4.,8.,7) * Units.deg
+    conditions = run_conditions(vehicle,alpha)
+
+    results_serial   = avl_serial.evaluate_conditions(conditions)
+    results_parallel = avl_parallel.evaluate_conditions(conditions)
+
+    CL_serial   = results_serial.aerodynamics.lift_coefficient
+    CL_parallel = results_parallel.aerodynamics.lift_coefficient
+    Cm_parallel = results_parallel.aerodynamics.pitch_moment_coefficient
+    CL_truth    = 0.2 + 0.1*alpha[:,None]/Units.deg
+
+    print 'Serial   CL = ', CL_serial[:,0]
+    print 'Parallel CL = ', CL_parallel[:,0]
+
+    # the worker folders are gone once their results are read
+    leftovers = [name for name in os.listdir(parallel_folder) if name.startswith('avl_worker')]
+    print 'Worker folders left = ', len(leftovers)
+
+    rmtree(run_folder)
+
+    # ------------------------------------------------------------------
+    #   Check Results
+    # ------------------------------------------------------------------
+
+    # the shards are merged back in case order
+    assert( np.max(np.abs(CL_parallel - CL_truth)) < 1e-4 )
+    assert( np.max(np.abs(Cm_parallel + 0.05*CL_truth)) < 1e-4 )
+    assert( np.max(np.abs(CL_parallel - CL_serial)) < 1e-10 )
+    assert( len(leftovers) == 0 )
+
+    cache_test(vehicle,avl_bin_name,run_folder)
+
+    return
+
+#: def main()
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def avl_setup(vehicle,avl_bin_name,run_folder,number_of_workers):
+
+    avl = SUAVE.Analyses.Aerodynamics.AVL()
+    avl.features   = vehicle
+    avl.keep_files = True
+    avl.cache      = None
+    avl.settings.filenames.avl_bin_name = avl_bin_name
+    avl.settings.filenames.run_folder   = run_folder
+    avl.settings.number_of_workers      = number_of_workers
+    avl.finalize()
+
+    return avl
+
+
+def cache_test(vehicle,avl_bin_name,run_folder):
+    """ repeated cases are read from the cache, a changed geometry is run
+        again, and the least recently used cases are dropped past the size
+    """
+
+    # by default the results are kept with the other SUAVE caches
+    assert( AVL_Cache().folder == cache_folder('avl') )
+
+    cache = AVL_Cache()
+    cache.folder       = tempfile.mkdtemp()
+    cache.maximum_size = 10
+
+    alpha      = np.linspace(-4.,8.,7) * Units.deg
+    conditions = run_conditions(vehicle,alpha)
+    CL_truth   = 0.2 + 0.1*alpha[:,None]/Units.deg
+
+    # first run, every case is new
+    avl = avl_setup(vehicle,avl_bin_name,run_folder,1)
+    avl.cache = cache
+    results_first = avl.evaluate_conditions(conditions)
+    assert( cache.hits == 0 and cache.misses == 7 )
+
+    # same geometry and cases, nothing is run
+    results_again = avl.evaluate_conditions(conditions)
+    assert( cache.hits == 7 and cache.misses == 7 )
+
+    CL_first = results_first.aerodynamics.lift_coefficient
+    CL_again = results_again.aerodynamics.lift_coefficient
+    assert( np.max(np.abs(CL_first - CL_truth)) < 1e-4 )
+    assert( np.max(np.abs(CL_again - CL_first)) < 1e-10 )
+
+    # more sweep changes the geometry file, so the same cases miss
+    swept = copy.deepcopy(vehicle)
+    swept.wings.main_wing.sweeps.quarter_chord += 5. * Units.deg
+    avl_swept = avl_setup(swept,avl_bin_name,run_folder,1)
+    avl_swept.cache = cache
+    avl_swept.evaluate_conditions(conditions)
+
+    print cache.report()
+
+    # 14 cases in a cache of 10, the 4 oldest are gone
+    files = [name for name in os.listdir(cache.folder) if name.endswith('.pkl')]
+    assert( cache.hits == 7 and cache.misses == 14 )
+    assert( cache.evictions == 4 )
+    assert( len(files) == 10 and len(cache.results) == 10 )
+
+    rmtree(cache.folder)
+    rmtree(run_folder)
+
+    return
+
+
+def run_conditions(vehicle,alpha):
+
+    conditions = Aero_Conditions()
+    ones_1col  = conditions.ones_row(1)
+    conditions.weights.total_mass  = ones_1col * vehicle.mass_properties.max_takeoff
+    conditions.freestream.velocity = ones_1col * 150. * Units.knots
+    conditions.freestream.density  = ones_1col * 1.225
+    conditions.freestream.gravity  = ones_1col * 9.81
+
+    conditions.expand_rows(len(alpha))
+    conditions.aerodynamics.angle_of_attack = alpha[:,None] * 1.
+    conditions.freestream.mach_number       = alpha[:,None] * 0. + 0.2
+
+    return conditions
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
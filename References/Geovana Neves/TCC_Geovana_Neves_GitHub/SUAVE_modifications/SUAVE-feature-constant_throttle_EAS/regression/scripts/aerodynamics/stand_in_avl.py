@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# stand_in_avl.py
+#
+# Created:  Oct 2026
+# Modified:
+
+""" Stand-in for the AVL executable, for testing the AVL analysis without AVL.
+
+    Called as AVL is, with the geometry file as argument and the input deck on
+    stdin. For every case run with 'x' and saved with 'st' it writes a
+    stability derivative file in the AVL layout, with canned coefficients that
+    only depend on the angle of attack of the case:
+
+        CL  = 0.2 + 0.1*alpha [deg]
+        CDi = CL**2/(pi*9.5*0.9)
+        Cm  = -0.05*CL
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import math
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    geometry = sys.argv[1]
+    cases    = {}
+    index    = None
+    previous = None
+
+    for line in sys.stdin:
+        command = line.strip()
+
+        if command.startswith('CASE '):
+            cases = read_run_cases(command[5:].strip())
+
+        elif previous == 'st':
+            write_results(command,cases[index],geometry)
+
+        elif command.isdigit():
+            index = int(command)
+
+        elif command == 'QUIT':
+            break
+
+        if command:
+            previous = command
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def read_run_cases(filename):
+    """ case number -> (tag, alpha [deg], mach) from a run case file
+    """
+
+    cases = {}
+    index = None
+
+    with open(filename,'r') as f:
+        for line in f:
+            words = line.split()
+            if line.strip().startswith('Run case'):
+                index = int(line.split(':')[0].split()[-1])
+                cases[index] = [line.split(':')[1].strip(),0.,0.]
+            elif index is not None and words[:3] == ['alpha','->','alpha']:
+                cases[index][1] = float(words[-1])
+            elif index is not None and words[:2] == ['Mach','=']:
+                cases[index][2] = float(words[2])
+
+    return cases
+
+
+def write_results(filename,case,geometry):
+    """ writes the total forces and stability derivatives of one case, laid
+        out as the AVL 'st' command does
+    """
+
+    tag, alpha, mach = case
+
+    CL  = 0.2 + 0.1*alpha
+    CDi = CL*CL/(math.pi*9.5*0.9)
+    Cm  = -0.05*CL
+
+    lines = [
+        ' ---------------------------------------------------------------',
+        ' Vortex Lattice Output -- Total Forces',
+        '',
+        ' Configuration: %s' % geometry,
+        '     # Surfaces =   4',
+        '     # Strips   =  60',
+        '     # Vortices = 600',
+        '',
+        '  Sref = 124.86       Cref = 4.2350       Bref = 35.660    ',
+        '  Xref = 18.288       Yref = 0.0000       Zref = 0.0000    ',
+        '',
+        ' Standard axis orientation,  X fwd, Z down         ',
+        '',
+        ' Run case: %s' % tag,
+        '',
+        '  Alpha =%10.5f    pb/2V =%10.5f    p\'b/2V =%10.5f' % (alpha,0.,0.),
+        '  Beta  =%10.5f    qc/2V =%10.5f' % (0.,0.),
+        '  Mach  =%10.3f    rb/2V =%10.5f    r\'b/2V =%10.5f' % (mach,0.,0.),
+        '',
+        '  CXtot =%10.5f    Cltot =%10.5f    Cl\'tot =%10.5f' % (0.,0.,0.),
+        '  CYtot =%10.5f    Cmtot =%10.5f' % (0.,Cm),
+        '  CZtot =%10.5f    Cntot =%10.5f    Cn\'tot =%10.5f' % (-CL,0.,0.),
+        '',
+        '  CLtot =%10.5f' % CL,
+        '  CDtot =%10.5f' % CDi,
+        '  CDvis =%10.5f    CDind =%10.5f' % (0.,CDi),
+        '  CLff  =%10.5f    CDff  =%10.5f    | Trefftz' % (CL,CDi),
+        '  CYff  =%10.5f        e =%10.4f    | Plane  ' % (0.,0.9),
+        '',
+        '',
+        ' ---------------------------------------------------------------',
+        '',
+        ' Stability-axis derivatives...',
+        '',
+        '                             alpha                beta',
+        '                  ----------------     ----------------',
+        ' z\' force CL |    CLa =%11.6f    CLb =%11.6f' % (0.1*180./math.pi,0.),
+        ' y  force CY |    CYa =%11.6f    CYb =%11.6f' % (0.,0.),
+        ' x\' mom.  Cl\'|    Cla =%11.6f    Clb =%11.6f' % (0.,0.),
+        ' y  mom.  Cm |    Cma =%11.6f    Cmb =%11.6f' % (-0.05*0.1*180./math.pi,0.),
+        ' z\' mom.  Cn\'|    Cna =%11.6f    Cnb =%11.6f' % (0.,0.),
+        '',
+        '                     roll rate  p\'      pitch rate  q\'        yaw rate  r\'',
+        '                  ----------------    ----------------    ----------------',
+        ' z\' force CL |    CLp =%11.6f    CLq =%11.6f    CLr =%11.6f' % (0.,0.,0.),
+        ' y  force CY |    CYp =%11.6f    CYq =%11.6f    CYr =%11.6f' % (0.,0.,0.),
+        ' x\' mom.  Cl\'|    Clp =%11.6f    Clq =%11.6f    Clr =%11.6f' % (0.,0.,0.),
+        ' y  mom.  Cm |    Cmp =%11.6f    Cmq =%11.6f    Cmr =%11.6f' % (0.,0.,0.),
+        ' z\' mom.  Cn\'|    Cnp =%11.6f    Cnq =%11.6f    Cnr =%11.6f' % (0.,0.,0.),
+        '',
+        ' Neutral point  Xnp =%11.6f' % 18.288,
+        '',
+        ' Clb Cnr / Clr Cnb  =%11.6f    (  > 1 if spirally stable )' % 0.,
+        '',
+    ]
+
+    with open(filename,'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# vortex_lattice.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.weissinger_vortex_lattice_multi import weissinger_vortex_lattice_multi
+from SUAVE.Methods.Utilities.cache_folder import cache_folder
+
+from mission_B737 import vehicle_setup
+
+import numpy as np
+import copy
+import os
+import shutil
+import tempfile
+
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    settings = Data()
+    settings.number_panels_spanwise  = 5
+    settings.number_panels_chordwise = 1
+
+    alpha = np.linspace(-10.,10.,21) * Units.deg
+
+    # every angle in one solve against one solve per angle
+    conditions = Data()
+    conditions.aerodynamics = Data()
+
+    for wing in vehicle.wings:
+
+        conditions.aerodynamics.angle_of_attack = alpha
+        CL_multi = weissinger_vortex_lattice_multi(conditions,settings,wing)
+
+        CL_single = np.zeros_like(alpha)
+        for i,_ in enumerate(alpha):
+            conditions.aerodynamics.angle_of_attack = alpha[i]
+            CL_single[i] = np.squeeze(weissinger_vortex_lattice(conditions,settings,wing)[0])
+
+        error = np.max(np.abs(CL_multi-CL_single))
+
+        print wing.tag
+        print 'Multiple right hand side CL = ', CL_multi[::5]
+        print 'One angle at a time CL      = ', CL_single[::5]
+        print 'Max CL difference           = ', error
+        print ''
+
+        assert( error < 1e-3 )
+
+    # lift slope of an untwisted rectangular wing against Helmbold
+    AR   = 8.
+    wing = SUAVE.Components.Wings.Wing()
+    wing.spans.projected      = np.sqrt(AR*100.)
+    wing.chords.root          = np.sqrt(100./AR)
+    wing.chords.tip           = wing.chords.root
+    wing.sweeps.quarter_chord = 0.
+    wing.twists.root          = 0.
+    wing.twists.tip           = 0.
+    wing.areas.reference      = 100.
+    wing.symmetric            = True
+    wing.vertical             = False
+
+    conditions.aerodynamics.angle_of_attack = np.array([0.,1.]) * Units.deg
+    CL = weissinger_vortex_lattice_multi(conditions,settings,wing)
+
+    CL_alpha = (CL[1]-CL[0])/(1. * Units.deg)
+    helmbold = 2.*np.pi*AR/(2. + np.sqrt(AR**2 + 4.))
+
+    print 'Lift slope, AR 8       = ', CL_alpha
+    print 'Helmbold lift slope    = ', helmbold
+
+    assert( np.abs(CL_alpha/helmbold - 1.) < 0.02 )
+
+    store_test(vehicle)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def store_test(vehicle):
+    """ identical wings reuse the surrogate training, a changed wing samples again
+    """
+
+    folder = tempfile.mkdtemp()
+
+    # a config with the flaps down has the same clean wings
+    flaps_down = copy.deepcopy(vehicle)
+    flaps_down.wings.main_wing.flaps.angle = 20. * Units.deg
+
+    # a config with more sweep does not
+    swept = copy.deepcopy(vehicle)
+    swept.wings.main_wing.sweeps.quarter_chord += 5. * Units.deg
+
+    analyses = []
+    for geometry in [vehicle,flaps_down,swept]:
+        aerodynamics = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+        aerodynamics.geometry     = geometry
+        aerodynamics.store.folder = folder
+        aerodynamics.initialize()
+        analyses.append(aerodynamics)
+
+    base,same,changed = analyses
+
+    print 'Identical wings, hits, misses = ', same.store.hits, same.store.misses
+    print 'Changed wing,    hits, misses = ', changed.store.hits, changed.store.misses
+
+    assert( same.store.hits == 1 and same.store.misses == 0 )
+    assert( changed.store.hits == 0 and changed.store.misses == 1 )
+    assert( np.all(same.training.lift_coefficient == base.training.lift_coefficient) )
+    assert( np.any(changed.training.lift_coefficient != base.training.lift_coefficient) )
+
+    # the changed wing was saved for the next run
+    key = changed.store.key(changed.tag,
+                            swept.wings,
+                            swept.reference_area,
+                            changed.settings.number_panels_spanwise,
+                            changed.settings.number_panels_chordwise,
+                            changed.training.angle_of_attack,
+                            changed.training.mach_number)
+    assert( os.path.exists(os.path.join(folder,key + '.npz')) )
+
+    shutil.rmtree(folder)
+
+    # by default the training is kept with the other SUAVE caches
+    default = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    assert( default.store.folder == cache_folder('surrogates') )
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
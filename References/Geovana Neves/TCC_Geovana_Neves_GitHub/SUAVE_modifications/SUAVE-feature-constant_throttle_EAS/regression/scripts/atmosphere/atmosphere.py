@@ -86,12 +86,91 @@ def main():
     assert( T_err   < 1e-5 )
     assert( rho_err < 1e-5 )
     assert( a_err   < 1e-5 )    
+    
+    table_test()
+    cache_test()
  
     return
 
 #: def main()
 
 
+def table_test():
+    """ The table must agree with the model to the interpolation tolerance,
+        with the temperature deviation given per point
+    """
+    
+    z         = np.linspace(-1,20,60) * Units.km
+    delta_isa = np.linspace(-15.,25.,60)
+    
+    atm   = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    model = atm.compute_values(z,delta_isa)
+    
+    atm.build_table()
+    table = atm.compute_values(z,delta_isa)
+    
+    for key in ['pressure','temperature','density','speed_of_sound','dynamic_viscosity']:
+        
+        # one value per altitude, not one per altitude and deviation pair
+        assert( model[key].shape == (len(z),1) )
+        
+        error = np.max( np.abs(table[key]-model[key])/model[key] )
+        print 'Max Table Relative Difference in %s = %.4e' % (key,error)
+        assert( error < 1e-4 )
+        
+    return
+
+
+def cache_test():
+    """ Hits, misses and eviction of the result cache, dropping the results
+        when the table changes, and complex steps passing by it
+    """
+    
+    z = np.linspace(0,10,5) * Units.km
+    
+    atm = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atm.settings.cache_size = 2
+    
+    # the third distinct column evicts the first
+    first = atm.compute_values(z)
+    again = atm.compute_values(z)
+    atm.compute_values(z+1.)
+    atm.compute_values(z*2.)
+    atm.compute_values(z)
+    
+    print 'Cache statistics:'
+    print atm.cache_statistics
+    
+    assert( atm.cache_statistics.hits   == 1 )
+    assert( atm.cache_statistics.misses == 4 )
+    assert( np.all(again.pressure == first.pressure) )
+    
+    # a hit is a copy, changing it does not change the stored result
+    again.pressure[:] = 0.
+    assert( np.all(atm.compute_values(z).pressure == first.pressure) )
+    
+    # the model results do not apply to the table
+    atm.build_table()
+    table = atm.compute_values(z)
+    assert( atm.cache_statistics.misses == 1 )
+    assert( np.all(table.pressure != first.pressure) )
+    assert( np.all(atm.compute_values(z).pressure == table.pressure) )
+    
+    # and the other way around
+    atm.table = None
+    assert( np.all(atm.compute_values(z).pressure == first.pressure) )
+    assert( len(atm.cache) == 1 )
+    
+    # complex steps bypass the cache, the temperature lapse rate comes through
+    h      = 1e-30
+    misses = atm.cache_statistics.misses
+    dT_dz  = atm.compute_values(z+1j*h).temperature.imag/h
+    assert( atm.cache_statistics.misses == misses )
+    assert( np.max(np.abs(dT_dz[:2] + 0.0065)) < 1e-4 )
+    
+    return
+
+
 # ----------------------------------------------------------------------        
 #   Helper Function
 # ---------------------------------------------------------------------- 
@@ -79,9 +79,126 @@ def main():
     
     for k,v in error.items():
         assert(np.abs(v)<0.001)
+        
+    performance_map_test(prop,atmosphere_conditions)
+    pitch_solver_test(prop,atmosphere_conditions)
      
     return
 
+
+def performance_map_test(prop,atmosphere_conditions):
+    """ The map must reproduce the blade element analysis inside its grid,
+        and is bypassed while the acoustic outputs are captured every pass
+    """
+    
+    # operating points around the design point, all inside the map
+    V     = np.array([[46.],[50.],[53.],[50.]])
+    omega = np.array([[1900.],[2000.],[2050.],[2100.]])*(2.*np.pi/60.0)
+    
+    conditions = operating_conditions(atmosphere_conditions,V)
+    
+    prop.inputs.omega     = omega
+    prop.acoustic_capture = 'always'
+    F_live, Q_live, P_live, Cp_live = prop.spin(conditions)
+    
+    # Reynolds number of the design point, the map spans a factor of two each way
+    R    = prop.prop_attributes.tip_radius
+    cbar = np.mean(prop.prop_attributes.chord_distribution)
+    nu   = atmosphere_conditions.dynamic_viscosity[0,0]/atmosphere_conditions.density[0,0]
+    Re   = prop.prop_attributes.angular_velocity*R*cbar/nu
+    
+    prop.build_performance_map(np.linspace(0.3,0.7,9),np.linspace(0.8,1.0,5),
+                               Re*np.array([0.5,1.,2.]),np.array([-0.05,0.,0.05]),save=False)
+    
+    # with acoustic_capture = 'always' the map has no station data, so spin ignores it
+    conditions = operating_conditions(atmosphere_conditions,V)
+    F, Q, P, Cp = prop.spin(conditions)
+    assert(np.all(F==F_live) and np.all(P==P_live))
+    assert('acoustic_outputs' in conditions.propulsion)
+    
+    prop.acoustic_capture = 'final'
+    conditions = operating_conditions(atmosphere_conditions,V)
+    F_map, Q_map, P_map, Cp_map = prop.spin(conditions)
+    
+    error = Data()
+    error.Thrust = np.max(np.abs(F_map-F_live)/np.abs(F_live))
+    error.Power  = np.max(np.abs(P_map-P_live)/np.abs(P_live))
+    error.Torque = np.max(np.abs(Q_map-Q_live)/np.abs(Q_live))
+    
+    print 'Map vs blade element relative errors:'
+    print  error
+    
+    for k,v in error.items():
+        assert(np.abs(v)<0.02)
+        
+    prop.performance_map  = None
+    prop.acoustic_capture = 'always'
+    
+    return
+
+
+def pitch_solver_test(prop,atmosphere_conditions):
+    """ solve_pitch must recover the pitch that gave a power or thrust, and
+        leave targets outside the pitch bounds unconverged at the closer bound
+    """
+    
+    V     = np.array([[45.],[50.],[55.]])
+    omega = np.ones_like(V)*prop.prop_attributes.angular_velocity
+    pitch = np.array([[-0.05],[0.02],[0.1]])
+    
+    prop.inputs.omega = omega
+    
+    # known power and thrust at the expected pitch
+    conditions = operating_conditions(atmosphere_conditions,V)
+    conditions.propulsion.pitch_command = pitch
+    F, Q, P, Cp = prop.spin_variable_pitch(conditions)
+    
+    for quantity, target in [('power',P),('thrust',F)]:
+        conditions = operating_conditions(atmosphere_conditions,V)
+        pitch_solved, converged = prop.solve_pitch(conditions,target,quantity=quantity)
+        
+        print 'Pitch error for ' + quantity + ':', np.max(np.abs(pitch_solved-pitch))
+        
+        assert(np.all(converged))
+        assert(np.max(np.abs(pitch_solved-pitch)) < 1e-3)
+        assert(np.all(conditions.propulsion.pitch_command == pitch_solved))
+        
+    # a power beyond the upper bound, and one below the lower bound
+    bounds = (-0.1,0.15)
+    target = np.array([[P[0,0]],[10.*P[1,0]],[-10.*P[2,0]]])
+    conditions = operating_conditions(atmosphere_conditions,V)
+    pitch_solved, converged = prop.solve_pitch(conditions,target,pitch_bounds=bounds)
+    
+    assert(np.all(converged[:,0] == [True,False,False]))
+    assert(np.abs(pitch_solved[0,0]-pitch[0,0]) < 1e-3)
+    assert(pitch_solved[1,0] == bounds[1])
+    assert(pitch_solved[2,0] == bounds[0])
+    
+    return
+
+
+def operating_conditions(atmosphere_conditions,V):
+    """ Sea level conditions for a column of freestream velocities
+    """
+    
+    ones = np.ones_like(V)
+    
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.frames     = Data()
+    conditions.frames.body     = Data()
+    conditions.frames.inertial = Data()
+    conditions.freestream.density           = atmosphere_conditions.density[0,0]*ones
+    conditions.freestream.dynamic_viscosity = atmosphere_conditions.dynamic_viscosity[0,0]*ones
+    conditions.freestream.speed_of_sound    = atmosphere_conditions.speed_of_sound[0,0]*ones
+    conditions.freestream.temperature       = atmosphere_conditions.temperature[0,0]*ones
+    conditions.frames.inertial.velocity_vector   = np.hstack([V,0.*V,0.*V])
+    conditions.propulsion.throttle               = ones*1.
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(len(V),1,1))
+    
+    return conditions
+
 # ----------------------------------------------------------------------        
 #   Call Main
 # ----------------------------------------------------------------------    
@@ -0,0 +1,391 @@
+# segment_jacobian.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Analyses.Mission.Segments.Conditions import State
+
+from SUAVE.Methods.Missions.Segments.converge_root_jacobian import converge_root_jacobian, \
+     complex_step_jacobian, finite_difference_jacobian, control_point_sparsity, point_index
+from SUAVE.Methods.Missions.Segments.Common.Cached_Numerics import initialize_differentials_cached
+from SUAVE.Methods.Missions.Segments.Common.Warm_Start import initialize_warm_start, update_warm_start
+from SUAVE.Methods.Missions.Segments.Common.Refinement import refine_control_points
+
+import warnings
+import numpy as np
+from copy import deepcopy
+
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    complex_step_test()
+    colored_finite_difference_test()
+    warm_start_test()
+    refinement_test()
+
+    return
+
+#: def main()
+
+
+def complex_step_test():
+    """ the complex step Jacobian through steps writing into float arrays,
+        and the iterate passes it saves with a sparsity
+    """
+
+    # root finder differencing the residuals itself
+    segment, state = toy_segment(16)
+    converge_root_jacobian(segment,state)
+    passes_default = segment.iterate_passes
+    solution       = state.unknowns.pack_array()
+
+    # complex step at the initial guess, the steps write into slices of
+    # float arrays of the conditions
+    segment, state = toy_segment(16)
+    state.numerics.jacobian = 'complex_step'
+    unknowns = state.unknowns.pack_array()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        J_complex = complex_step_jacobian(unknowns,segment,state)
+    J_difference = finite_difference_jacobian(unknowns,segment,state)
+    jacobian_error = np.max(np.abs(J_complex - J_difference))
+
+    # complex step with the control points stepped together
+    segment, state = toy_segment(16)
+    state.numerics.jacobian          = 'complex_step'
+    state.numerics.jacobian_sparsity = local_sparsity(state)
+    converge_root_jacobian(segment,state)
+    passes_complex = segment.iterate_passes
+    solution_error = np.max(np.abs(state.unknowns.pack_array() - solution))
+
+    print 'Complex step warnings            = ', len(caught)
+    print 'Complex step vs finite difference = ', jacobian_error
+    print 'Iterate passes, root finder       = ', passes_default
+    print 'Iterate passes, complex step      = ', passes_complex
+
+    assert( len(caught) == 0 )
+    assert( state.numerics.jacobian == 'complex_step' )
+    assert( jacobian_error < 1e-6 )
+    assert( state.numerics.converged )
+    assert( solution_error < 1e-8 )
+    assert( passes_complex < passes_default/2 )
+
+    return
+
+
+def colored_finite_difference_test():
+    """ the sparsity of a 64 point segment, detected on the first evaluation
+        and reused by the next ones
+    """
+
+    n_points = 64
+
+    # root finder differencing the residuals itself
+    segment, state = toy_segment(n_points,fuel_fraction=0.1)
+    converge_root_jacobian(segment,state)
+    passes_default = segment.iterate_passes
+    solution       = state.unknowns.pack_array()
+
+    # the declared sparsity holds the coupling through the mass integration,
+    # which the point by point pattern misses
+    segment, state = toy_segment(n_points,fuel_fraction=0.1)
+    unknowns = state.unknowns.pack_array()
+    coupled  = complex_step_jacobian(unknowns,segment,state) != 0.
+    declared_covers = np.all(control_point_sparsity(state)[coupled])
+    local_covers    = np.all(local_sparsity(state)[coupled])
+
+    # first evaluation detects the sparsity, the second reuses it
+    segment, state = toy_segment(n_points,fuel_fraction=0.1)
+    passes_colored = []
+    for evaluation in range(2):
+        segment.iterate_passes = 0
+        state = toy_state(segment,n_points)
+        state.numerics.jacobian = 'colored_finite_difference'
+        converge_root_jacobian(segment,state)
+        passes_colored.append(segment.iterate_passes)
+        solution_error = np.max(np.abs(state.unknowns.pack_array() - solution))
+        assert( state.numerics.converged )
+        assert( solution_error < 1e-8 )
+
+    print 'Iterate passes, root finder         = ', passes_default
+    print 'Iterate passes, colored, detecting  = ', passes_colored[0]
+    print 'Iterate passes, colored, stored     = ', passes_colored[1]
+
+    assert( declared_covers )
+    assert( not local_covers )
+    assert( segment.detected_jacobian_sparsity.shape == (len(unknowns),len(unknowns)) )
+
+    # another segment with the same tag detects its own
+    other, state = toy_segment(n_points,fuel_fraction=0.1)
+    assert( other.get('detected_jacobian_sparsity',None) is None )
+    assert( passes_colored[1] < passes_default/4 )
+
+    return
+
+
+def warm_start_test():
+    """ the converged unknowns kept on each segment seed its next
+        evaluation, segments with the same tag keep their own
+    """
+
+    n_points = 16
+    first,  state = toy_segment(n_points)
+    second, state = toy_segment(n_points,fuel_fraction=0.3)
+
+    seeded = []
+    for evaluation in range(2):
+        for segment in [first,second]:
+            state = toy_state(segment,n_points)
+            state.numerics.warm_start               = True
+            state.numerics.warm_start_extrapolation = False
+            initialize_warm_start(segment,state)
+            seeded.append(state.numerics.default_unknowns is not None)
+            converge_root_jacobian(segment,state)
+            update_warm_start(segment,state)
+            assert( state.numerics.converged )
+
+    repeat_error = np.max(np.abs(first.warm_start_solutions[-1] - first.warm_start_solutions[-2]))
+    difference   = np.max(np.abs(first.warm_start_solutions[-1] - second.warm_start_solutions[-1]))
+
+    print 'Warm started evaluations         = ', seeded
+    print 'Warm start, change of solution   = ', repeat_error
+
+    assert( seeded == [False,False,True,True] )
+    assert( len(first.warm_start_solutions) == 2 )
+    assert( repeat_error < 1e-8 )
+    assert( difference > 1e-3 )
+
+    return
+
+
+def refinement_test():
+    """ a segment refined from 4 to 7 control points, kept on the segment
+        only when asked, and put back on 4 points if the refined solve fails
+    """
+
+    # every evaluation refines again, the coarse solve is warm started
+    segment = refinement_segment(keep_refinement=False)
+    passes  = []
+    for evaluation in range(2):
+        state, seeded = evaluate_segment(segment)
+        passes.append(segment.iterate_passes)
+        assert( state.numerics.converged )
+        assert( state.numerics.number_control_points == 7 )
+        assert( state.numerics.discretization_error < 1e-6 )
+        assert( seeded == (evaluation > 0) )
+    assert( segment.state.numerics.number_control_points == 4 )
+
+    # the refined number is kept, the next evaluations solve on 7 points
+    kept = refinement_segment(keep_refinement=True)
+    passes_kept = []
+    for evaluation in range(2):
+        state, seeded = evaluate_segment(kept)
+        passes_kept.append(kept.iterate_passes)
+        assert( state.numerics.converged )
+        assert( seeded == (evaluation > 0) )
+    assert( kept.state.numerics.number_control_points == 7 )
+
+    # the refined solve fails, the coarse solution is put back
+    failing = refinement_segment(keep_refinement=True)
+    failing.process.iterate.diverge = diverge_above_4_points
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        state, seeded = evaluate_segment(failing)
+    coarse_residual = np.max(np.abs(state.residuals.pack_array()))
+
+    print 'Iterate passes, refining, cold       = ', passes[0]
+    print 'Iterate passes, refining, warm       = ', passes[1]
+    print 'Iterate passes, refined number kept  = ', passes_kept[1]
+    print 'Failed refinement, residual on 4 pts = ', coarse_residual
+
+    assert( passes[1] < passes[0] )
+    assert( passes_kept[1] < passes[1] )
+    assert( state.numerics.converged )
+    assert( state.numerics.number_control_points == 4 )
+    assert( state.unknowns.throttle.shape == (4,1) )
+    assert( coarse_residual < 1e-8 )
+    assert( failing.state.numerics.number_control_points == 4 )
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Toy Segment
+# ----------------------------------------------------------------------
+
+def toy_segment(number_control_points,fuel_fraction=0.):
+    """ a segment with the layout of a cruise, throttle and body angle
+        unknowns balancing forces and moments at every control point, with
+        the mass integrated from the throttle if fuel_fraction is not zero
+    """
+
+    segment = Data()
+    segment.tag            = 'toy_cruise'
+    segment.fuel_fraction  = fuel_fraction
+    segment.iterate_passes = 0
+
+    segment.process = Data()
+    segment.process.iterate = Process()
+    segment.process.iterate.forces    = update_forces
+    segment.process.iterate.residuals = update_residuals
+    segment.process.iterate.count     = count_pass
+
+    state = toy_state(segment,number_control_points)
+
+    return segment, state
+
+
+def toy_state(segment,number_control_points):
+    """ a new state of the toy segment, at the default guesses
+    """
+
+    state = State()
+    numerics = state.numerics
+    numerics.number_control_points       = number_control_points
+    numerics.tolerance_solution          = 1e-10
+    numerics.jacobian                    = None
+    numerics.jacobian_sparsity           = None
+    numerics.jacobian_sparsity_tolerance = 1e-3
+    initialize_differentials_cached(segment,state)
+    expand_toy_state(segment,state)
+
+    return state
+
+
+def expand_toy_state(segment,state):
+    """ the default guesses, one row per control point
+    """
+
+    ones_row = np.ones((state.numerics.number_control_points,1))
+
+    state.unknowns.throttle   = 0.5 * ones_row
+    state.unknowns.body_angle = 0.1 * ones_row
+
+    state.residuals.forces    = 0. * ones_row
+    state.residuals.moments   = 0. * ones_row
+
+    state.conditions.mass     = 1. * ones_row
+    state.conditions.thrust   = 0. * ones_row
+    state.conditions.drag     = 0. * ones_row
+
+    return
+
+
+def refinement_segment(keep_refinement):
+    """ the toy segment on 4 control points with the initialize and
+        converge processes of a mission segment, warm start and refinement
+    """
+
+    segment, state = toy_segment(4,fuel_fraction=0.3)
+
+    segment.process.initialize = Process()
+    segment.process.initialize.expand_state  = expand_toy_state
+    segment.process.initialize.differentials = initialize_differentials_cached
+    segment.process.initialize.warm_start    = initialize_warm_start
+
+    segment.process.converge = Process()
+    segment.process.converge.converge_root = converge_root_jacobian
+    segment.process.converge.refinement    = refine_control_points
+    segment.process.converge.warm_start    = update_warm_start
+
+    numerics = state.numerics
+    numerics.warm_start                  = True
+    numerics.warm_start_extrapolation    = False
+    numerics.maximum_control_points      = 33
+    numerics.refinement_tolerance        = 1e-6
+    numerics.refinement_states           = ['mass','weights.total_mass']
+    numerics.keep_refined_control_points = keep_refinement
+
+    segment.state = state
+
+    return segment
+
+
+def evaluate_segment(segment):
+    """ initializes and converges a copy of the segment state, as a mission
+        evaluation does, and tells if the unknowns were warm started
+    """
+
+    state = deepcopy(segment.state)
+    segment.iterate_passes = 0
+
+    segment.process.initialize(segment,state)
+    seeded = state.numerics.default_unknowns is not None
+    segment.process.converge(segment,state)
+
+    return state, seeded
+
+
+def diverge_above_4_points(segment,state):
+    """ residuals with no root on more than 4 control points
+    """
+
+    if state.numerics.number_control_points > 4:
+        state.residuals.forces = state.residuals.forces + 1. + state.unknowns.throttle**2
+
+    return
+
+
+def update_forces(segment,state):
+
+    conditions = state.conditions
+    throttle   = state.unknowns.throttle
+    body_angle = state.unknowns.body_angle
+    I          = state.numerics.dimensionless.integrate
+
+    # written into the columns of the conditions, as the segment steps do
+    conditions.mass[:,0]   = 1. - segment.fuel_fraction * np.dot(I,throttle)[:,0]
+    conditions.thrust[:,0] = throttle[:,0] * (1. - 0.2*throttle[:,0])
+    conditions.drag[:,0]   = 0.1 + 0.5*np.sin(body_angle[:,0])**2
+
+    return
+
+
+def update_residuals(segment,state):
+
+    conditions = state.conditions
+    throttle   = state.unknowns.throttle
+    body_angle = state.unknowns.body_angle
+
+    state.residuals.forces  = conditions.thrust*np.cos(body_angle) - conditions.drag - 0.3*conditions.mass
+    state.residuals.moments = np.sin(body_angle) - 0.5*throttle + 0.1*np.exp(body_angle)*conditions.mass
+
+    return
+
+
+def count_pass(segment,state):
+
+    segment.iterate_passes += 1
+
+    return
+
+
+def local_sparsity(state):
+    """ residuals x unknowns sparsity of residuals that only depend on the
+        unknowns at their own control point
+    """
+
+    n_points = state.numerics.number_control_points
+    rows     = point_index(state.residuals,n_points)[:,None]
+    columns  = point_index(state.unknowns,n_points)[None,:]
+
+    return rows == columns
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
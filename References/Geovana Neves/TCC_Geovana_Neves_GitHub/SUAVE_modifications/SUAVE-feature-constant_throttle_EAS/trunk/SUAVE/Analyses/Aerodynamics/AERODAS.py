@@ -36,10 +36,7 @@ class AERODAS(Markup):
         compute.setup_data = Methods.AERODAS_setup.setup_data
     
         # Get all of the coefficients for AERODAS wings
-        compute.wings_coefficients = Process()
         compute.wings_coefficients = Process_Geometry('wings')
-        compute.wings_coefficients.section_properties  = Methods.section_properties.section_properties
-        compute.wings_coefficients.finite_aspect_ratio = Methods.finite_aspect_ratio.finite_aspect_ratio
         compute.wings_coefficients.pre_stall           = Methods.pre_stall_coefficients.pre_stall_coefficients
         compute.wings_coefficients.post_stall          = Methods.post_stall_coefficients.post_stall_coefficients
         
@@ -56,8 +53,101 @@ class AERODAS(Markup):
         compute.drag = Process()
         compute.drag.total                             = Methods.AERODAS_setup.drag_total
         
-        def initialize(self):
-            self.process.compute.lift.inviscid_wings.geometry = self.geometry
-            self.process.compute.lift.inviscid_wings.initialize()
+        # geometry only wing properties, see prepare
+        self.process.prepare = Process_Geometry('wings')
+        prepare = self.process.prepare
+        prepare.section_properties  = Methods.section_properties.section_properties
+        prepare.finite_aspect_ratio = Methods.finite_aspect_ratio.finite_aspect_ratio
+        
+        self.prepared_points     = None
+        self.prepared_properties = {}
+        
+        
+    def initialize(self):
+        self.prepared_points     = None
+        self.prepared_properties = {}
+        self.compile_process()
+        
+    finalize = initialize
+    
+    
+    def evaluate(self,state):
+        
+        number_of_points = state.conditions.aerodynamics.angle_of_attack.shape[0]
+        if number_of_points != self.prepared_points:
+            prepared = self.prepared_properties.get(number_of_points,None)
+            if prepared is None:
+                self.prepare(state)
+            else:
+                set_leaves(self.geometry.wings,prepared)
+                self.prepared_points = number_of_points
             
-        finalize = initialize   
\ No newline at end of file
+        return Markup.evaluate(self,state)
+    
+    
+    def prepare(self,state):
+        """ Runs the geometry only steps of the wings, section_properties and
+            finite_aspect_ratio, which store their results on each wing
+
+            Inputs:
+                state.conditions, only for the number of points
+                settings.section_zero_lift_angle_of_attack
+                settings.section_lift_curve_slope
+                geometry.wings
+
+            Outputs:
+                the wing section and finite aspect ratio properties
+                prepared_properties - the wing fields the steps set, per number of points
+
+            Assumptions:
+                The properties are sized to the points of the state. The wing
+                fields the steps replace are kept for each number of points, and
+                evaluate puts them back when it sees that number again, so the
+                steps run once per number of points, not on every change of
+                size, e.g. when a mission alternates between segments with
+                different numbers of control points. Call initialize again after
+                changing the wings or the settings.
+        """
+        
+        wings  = self.geometry.wings
+        before = dict(get_leaves(wings))
+        
+        self.process.prepare(state,self.settings,self.geometry)
+        
+        number_of_points = state.conditions.aerodynamics.angle_of_attack.shape[0]
+        self.prepared_properties[number_of_points] = [(path,value) for path,value in get_leaves(wings)
+                                                      if before.get(path,None) is not value]
+        self.prepared_points = number_of_points
+        
+        return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def get_leaves(data,path=()):
+    """ (path, value) of every field of data that is not itself a Data
+    """
+    
+    leaves = []
+    for key, value in data.items():
+        if isinstance(value,dict):
+            leaves.extend(get_leaves(value,path + (key,)))
+        else:
+            leaves.append((path + (key,),value))
+    
+    return leaves
+
+
+def set_leaves(data,leaves):
+    """ puts back fields saved with get_leaves
+    """
+    
+    for path, value in leaves:
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+        parent[path[-1]] = value
+    
+    return
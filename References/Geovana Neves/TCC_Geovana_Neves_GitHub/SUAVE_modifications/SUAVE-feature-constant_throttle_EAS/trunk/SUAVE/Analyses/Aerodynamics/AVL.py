@@ -9,7 +9,10 @@
 # ----------------------------------------------------------------------
 
 import os
+import tempfile
+import multiprocessing
 import numpy as np
+from copy import deepcopy
 from shutil import rmtree
 from warnings import warn
 
@@ -31,6 +34,7 @@ from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
 
 from Aerodynamics import Aerodynamics as Aero_Analysis
+from AVL_Cache    import AVL_Cache
 
 
 # ----------------------------------------------------------------------
@@ -51,27 +55,50 @@ class AVL(Aero_Analysis):
         self.keep_files = True
 
         self.settings = Settings()
+        self.settings.number_of_workers = 1 # AVL processes run side by side
 
         self.current_status = Data()
         self.current_status.batch_index = 0
         self.current_status.batch_file  = None
         self.current_status.deck_file   = None
         self.current_status.cases       = None
+        self.current_status.run_folder  = None
+
+        # results of cases already run, None runs every case
+        self.cache = AVL_Cache()
         
         self.features = None
 
 
     def finalize(self):
+        """ makes the run folder of this analysis
+
+            Inputs:
+                settings.filenames.run_folder - parent of the analysis run folders
+
+            Outputs:
+                current_status.run_folder
+
+            Assumptions:
+                Every analysis gets a fresh folder of its own under the parent,
+                so analyses sharing settings, or in other processes, can run at
+                the same time. The folder of an earlier finalize of this
+                analysis is deleted, the parent and other folders are left alone.
+        """
 
         features = self.features
         self.tag      = 'avl_analysis_of_{}'.format(features.tag)
 
-        run_folder = self.settings.filenames.run_folder
-        if os.path.exists(run_folder):
+        run_folder = self.current_status.run_folder
+        if run_folder is not None and os.path.exists(run_folder):
             if self.keep_files:
                 warn('deleting old avl run files',Warning)
             rmtree(run_folder)
-        os.mkdir(run_folder)
+
+        parent = os.path.abspath(self.settings.filenames.run_folder)
+        if not os.path.exists(parent):
+            os.makedirs(parent)
+        self.current_status.run_folder = tempfile.mkdtemp(prefix=self.tag + '_',dir=parent)
 
         return
 
@@ -104,11 +131,15 @@ class AVL(Aero_Analysis):
                 case data on moment coefficients and control derivatives
 
             Assumptions:
+                cases already in self.cache, same geometry file text and
+                run case numbers, are not run again
 
         """
         
         # unpack
-        run_folder      = os.path.abspath(self.settings.filenames.run_folder)
+        if self.current_status.run_folder is None:
+            self.finalize()
+        run_folder      = self.current_status.run_folder
         output_template = self.settings.filenames.output_template
         batch_template  = self.settings.filenames.batch_template
         deck_template   = self.settings.filenames.deck_template
@@ -127,14 +158,40 @@ class AVL(Aero_Analysis):
         for case in cases:
             case.result_filename = output_template.format(case.tag)
 
-        # write the input files
-        with redirect.folder(run_folder,force=False):
-            write_geometry(self)
-            write_run_cases(self)
-            write_input_deck(self)
-
-            # RUN AVL!
-            results_avl = run_analysis(self)
+        # only run the cases not seen before
+        if self.cache is not None:
+            with redirect.folder(run_folder,force=False):
+                write_geometry(self)
+                with open(self.settings.filenames.features,'r') as f:
+                    geometry_text = f.read()
+            case_list = [case for case in cases]
+            keys      = [self.cache.key(geometry_text,case) for case in case_list]
+            cached    = [self.cache.load(key) for key in keys]
+            new_cases = [case for case,case_result in zip(case_list,cached) if case_result is None]
+            self.current_status.cases = select_cases(cases,new_cases)
+
+        # write the input files and RUN AVL!
+        number_of_cases   = len(self.current_status.cases)
+        number_of_workers = min(self.settings.number_of_workers,number_of_cases)
+        if number_of_cases == 0:
+            results_avl = Data()
+        elif number_of_workers > 1:
+            results_avl = self.run_cases_in_parallel(run_folder,number_of_workers)
+        else:
+            results_avl = run_avl_cases(self,run_folder)
+
+        # put the cached results back in case order
+        if self.cache is not None:
+            self.current_status.cases = cases
+            new_results = results_avl
+            results_avl = new_results.__class__()
+            for case,key,case_result in zip(case_list,keys,cached):
+                if case_result is None:
+                    case_result = new_results[case.tag]
+                    self.cache.save(key,case_result)
+                else:
+                    case_result.tag = case.tag
+                results_avl[case.tag] = case_result
 
         # translate results
         results = translate_results_to_conditions(cases,results_avl)
@@ -145,8 +202,101 @@ class AVL(Aero_Analysis):
         return results
 
 
+    def run_cases_in_parallel(self,run_folder,number_of_workers):
+        """ runs the current cases on a pool of AVL processes
+
+            Inputs:
+                current_status.cases - the cases of this batch, in order
+                run_folder           - where the worker folders are made
+                number_of_workers    - size of the pool
+
+            Outputs:
+                results_avl - as from run_analysis, in the order of the cases
+
+            Assumptions:
+                The cases are split into contiguous shards, one per worker.
+                Each shard writes its own geometry, run cases and input deck
+                in a fresh folder under run_folder, so the workers never share
+                files, and the results are merged back in case order. The
+                worker folders are deleted once their results are read.
+                The AVL executable is settings.filenames.avl_bin_name, any
+                program that writes the expected result files will do.
+        """
+
+        cases  = [case for case in self.current_status.cases]
+        shards = np.array_split(np.arange(len(cases)),number_of_workers)
+
+        # an analysis per shard, with only its own cases and no cache
+        cache      = self.cache
+        self.cache = None
+        jobs = []
+        for i,shard in enumerate(shards):
+            avl_shard = deepcopy(self)
+            avl_shard.current_status.cases = select_cases(self.current_status.cases,
+                                                          [cases[j] for j in shard])
+            folder = tempfile.mkdtemp(prefix='avl_worker_{}_'.format(i),dir=run_folder)
+            jobs.append((avl_shard,folder))
+        self.cache = cache
+
+        pool = multiprocessing.Pool(number_of_workers)
+        try:
+            shard_results = pool.map(run_avl_shard,jobs)
+        finally:
+            pool.close()
+            pool.join()
+            for avl_shard, folder in jobs:
+                rmtree(folder,ignore_errors=True)
+
+        # merge, shards are contiguous so this is the case order
+        results_avl = shard_results[0]
+        for shard_result in shard_results[1:]:
+            for tag,case_result in shard_result.items():
+                results_avl[tag] = case_result
+
+        return results_avl
+
+
     def __call__(self,*args,**kwarg):
         return self.evaluate(*args,**kwarg)
     
     
     initialize = finalize
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def select_cases(cases,selected):
+    """ copy of the cases container holding only the selected cases, in order
+    """
+
+    subset = deepcopy(cases)
+    subset.clear()
+    for case in selected:
+        subset.append(deepcopy(case))
+
+    return subset
+
+
+def run_avl_cases(avl_object,run_folder):
+    """ writes the input files of the current cases in run_folder and runs AVL
+    """
+
+    with redirect.folder(run_folder,force=False):
+        write_geometry(avl_object)
+        write_run_cases(avl_object)
+        write_input_deck(avl_object)
+
+        results_avl = run_analysis(avl_object)
+
+    return results_avl
+
+
+def run_avl_shard(job):
+    """ pool worker, job is (avl_object,run_folder)
+    """
+
+    avl_object, run_folder = job
+
+    return run_avl_cases(avl_object,run_folder)
@@ -0,0 +1,135 @@
+# AVL_Cache.py
+#
+# Created:  Oct 2026
+# Modified:
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import pickle
+from copy import deepcopy
+from collections import OrderedDict
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.update_digest import update_digest
+from SUAVE.Methods.Utilities.cache_folder import cache_folder
+
+# run case fields that only name the case
+_case_name_fields = ['tag','index','result_filename']
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class AVL_Cache(Data):
+    """ SUAVE.Analyses.Aerodynamics.AVL_Cache
+        results of single AVL run cases, keyed on the text of the .avl
+        geometry file and the numbers of the run case
+
+        Results are kept in memory and pickled in a folder, both bounded
+        to maximum_size cases, the least recently used are dropped first.
+    """
+
+    def __defaults__(self):
+        self.tag          = 'avl_cache'
+        self.folder       = cache_folder('avl') # None keeps the results in memory only
+        self.maximum_size = 1000
+
+        self.results   = OrderedDict()
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+
+    def key(self,geometry_text,case):
+        """ digest of the geometry file text and the run case, without its
+            tag, index and result file name
+        """
+
+        sha = hashlib.sha1()
+        sha.update(geometry_text.encode('utf-8'))
+        update_digest(sha,case,_case_name_fields)
+
+        return sha.hexdigest()
+
+
+    def load(self,key):
+        """ the result stored under key, or None
+        """
+
+        results = self.results
+
+        if key in results:
+            case_result  = results.pop(key)
+            results[key] = case_result
+            self.hits   += 1
+            return deepcopy(case_result)
+
+        if self.folder is not None:
+            filename = os.path.join(self.folder,key + '.pkl')
+            if os.path.exists(filename):
+                with open(filename,'rb') as f:
+                    case_result = pickle.load(f)
+                os.utime(filename,None)
+                self.remember(key,case_result)
+                self.hits += 1
+                return deepcopy(case_result)
+
+        self.misses += 1
+
+        return None
+
+
+    def save(self,key,case_result):
+        """ stores the result of a case run under key
+        """
+
+        case_result = deepcopy(case_result)
+        self.remember(key,case_result)
+
+        if self.folder is not None:
+            if not os.path.exists(self.folder):
+                os.makedirs(self.folder)
+            with open(os.path.join(self.folder,key + '.pkl'),'wb') as f:
+                pickle.dump(case_result,f,pickle.HIGHEST_PROTOCOL)
+
+            # drop the least recently used files
+            filenames = [os.path.join(self.folder,name) for name in os.listdir(self.folder)
+                         if name.endswith('.pkl')]
+            if len(filenames) > self.maximum_size:
+                filenames.sort(key=os.path.getmtime)
+                for filename in filenames[:len(filenames)-self.maximum_size]:
+                    os.remove(filename)
+                    self.evictions += 1
+
+        return
+
+
+    def remember(self,key,case_result):
+        """ keeps a result in memory, dropping the least recently used
+        """
+
+        results      = self.results
+        results[key] = case_result
+        while len(results) > self.maximum_size:
+            results.popitem(last=False)
+            if self.folder is None:
+                self.evictions += 1
+
+        return
+
+
+    def report(self):
+        """ one line summary of the cache use
+        """
+
+        requests = self.hits + self.misses
+        rate     = 100. * self.hits / requests if requests else 0.
+
+        return 'AVL cache: {} hits, {} misses ({:.1f}% hit rate), {} evictions, {} cases in memory'.format(
+            self.hits,self.misses,rate,self.evictions,len(self.results))
@@ -20,6 +20,7 @@ from Results import Results
 from SUAVE.Methods.Aerodynamics import Fidelity_Zero as Methods
 from Process_Geometry import Process_Geometry
 from Vortex_Lattice import Vortex_Lattice
+from Stacked_Wings_Drag import Stacked_Wings_Drag
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -70,14 +71,13 @@ class Fidelity_Zero(Markup):
 
         compute.lift.inviscid_wings                = Vortex_Lattice()
         compute.lift.vortex                        = SUAVE.Methods.skip
-        compute.lift.compressible_wings            = Methods.Lift.wing_compressibility_correction
+        compute.lift.compressible_wings            = SUAVE.Methods.skip # in the vortex lattice surrogate
         compute.lift.fuselage                      = Methods.Lift.fuselage_correction
         compute.lift.total                         = Methods.Lift.aircraft_total
         
         compute.drag = Process()
         compute.drag.parasite                      = Process()
-        compute.drag.parasite.wings                = Process_Geometry('wings')
-        compute.drag.parasite.wings.wing           = Methods.Drag.parasite_drag_wing 
+        compute.drag.parasite.wings                = Stacked_Wings_Drag() # also the wing compressibility drag
         compute.drag.parasite.fuselages            = Process_Geometry('fuselages')
         compute.drag.parasite.fuselages.fuselage   = Methods.Drag.parasite_drag_fuselage
         compute.drag.parasite.propulsors           = Process_Geometry('propulsors')
@@ -86,8 +86,7 @@ class Fidelity_Zero(Markup):
         compute.drag.parasite.total                = Methods.Drag.parasite_total
         compute.drag.induced                       = Methods.Drag.induced_drag_aircraft
         compute.drag.compressibility               = Process()
-        compute.drag.compressibility.wings         = Process_Geometry('wings')
-        compute.drag.compressibility.wings.wing    = Methods.Drag.compressibility_drag_wing
+        compute.drag.compressibility.wings         = SUAVE.Methods.skip # in the stacked wings drag
         compute.drag.compressibility.total         = Methods.Drag.compressibility_drag_wing_total
         compute.drag.miscellaneous                 = Methods.Drag.miscellaneous_drag_aircraft_ESDU
         compute.drag.untrimmed                     = Methods.Drag.untrimmed
@@ -99,5 +98,8 @@ class Fidelity_Zero(Markup):
     def initialize(self):
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
+        self.process.compute.drag.parasite.wings.geometry = self.geometry
+        self.process.compute.drag.parasite.wings.initialize()
+        self.compile_process()
         
     finalize = initialize
\ No newline at end of file
@@ -9,7 +9,8 @@
 
 from SUAVE.Core import Data
 from Aerodynamics import Aerodynamics
-from SUAVE.Analyses import Process
+from SUAVE.Analyses import Process, Results
+from Process_Geometry import Process_Geometry
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -28,19 +29,149 @@ class Markup(Aerodynamics):
         self.process = Process()
         self.process.initialize = Process()
         self.process.compute = Process()
+
+        # flat form of process.compute, see compile_process
+        self.compiled_process = None
+
+        # 'full' records the lift and drag breakdowns on every evaluation,
+        # 'totals' lets the steps skip the per-component entries that the
+        # totals do not read, see record_breakdown
+        self.settings.recording_level = 'full'
         
         
     def evaluate(self,state):
+        """ Runs the process on the state
+
+            Inputs:
+                state.conditions
+                settings.recording_level
+
+            Outputs:
+                results of process.compute
+
+            Assumptions:
+                The steps get settings.recording_level with the other settings.
+                With 'totals' a step may leave out the breakdown entries that
+                only describe the components, e.g. Stacked_Wings_Drag keeps the
+                per-wing drag coefficients and skips the skin friction, form
+                factor and drag divergence records, so the solver iterations of
+                a segment compute and hold less. The finalize pass of the
+                segment records the full breakdown of the converged state with
+                record_breakdown.
+        """
+
+        return self.run_process(state)
+
+
+    def record_breakdown(self,state):
+        """ Runs the process on the state with the full lift and drag
+            breakdowns, whatever the recording level
+        """
+
+        settings = self.settings
+        recording_level = settings.recording_level
+        settings.recording_level = 'full'
+        try:
+            results = self.run_process(state)
+        finally:
+            settings.recording_level = recording_level
+
+        return results
+
+
+    def run_process(self,state):
+        """ Runs the compiled steps on the state, or process.compute if the
+            process is not compiled
+        """
         
         settings = self.settings
         geometry = self.geometry
+
+        compiled = self.compiled_process
+        if compiled is None:
+            results = self.process.compute(state,settings,geometry)
+            return results
+
+        # the flat list of steps, in the order the tree would run them,
+        # filling a new results tree on every call
+        containers = [Results()]
+        for index, tag, step, step_geometry in compiled.steps:
+            if step is None:
+                containers[index][tag] = Results()
+                containers.append(containers[index][tag])
+            else:
+                containers[index][tag] = step(state,settings,step_geometry)
         
-        results = self.process.compute(state,settings,geometry)
-        
-        return results
+        return containers[0]
         
     def initialize(self):
         self.process.initialize(self)
-    
-        
-        
\ No newline at end of file
+        self.compile_process()
+
+    def compile_process(self):
+        """ Flattens process.compute into a list of steps for evaluate
+
+            Inputs:
+                process.compute
+                geometry
+
+            Outputs:
+                compiled_process.steps - (container, tag, function, geometry) per step
+
+            Assumptions:
+                Nested Processes are unrolled, Process_Geometry items are looked
+                up once, and analyses are bound to their evaluate. A step with
+                no function adds a new Results container, containers are
+                numbered in the order they are added, 0 being the top of the
+                tree. Every evaluate builds a new results tree with the same
+                layout as from process.compute, so results of earlier calls
+                are left alone.
+                Compile again after changing the process or the geometry, set
+                compiled_process to None to walk the tree instead.
+        """
+
+        compiled = Data()
+        compiled.steps = []
+
+        compile_steps(self.process.compute,self.geometry,0,compiled.steps)
+
+        self.compiled_process = compiled
+
+        return compiled
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def compile_steps(process,geometry,index,steps):
+    """ appends the steps of process to steps, with container index as
+        their results
+    """
+
+    for tag, step in process.items():
+
+        if type(step) is Process:
+            compile_steps(step,geometry,add_container(steps,index,tag),steps)
+
+        elif isinstance(step,Process_Geometry):
+            step_index = add_container(steps,index,tag)
+            for key, this_geometry in geometry.deep_get(step.geometry_key).items():
+                compile_steps(step,this_geometry,add_container(steps,step_index,key),steps)
+
+        elif callable(step):
+            if hasattr(step,'evaluate'):
+                step = step.evaluate
+            steps.append((index,tag,step,geometry))
+
+    return
+
+
+def add_container(steps,index,tag):
+    """ appends a step adding container tag to container index, returns
+        the number of the new container
+    """
+
+    steps.append((index,tag,None,None))
+
+    return len([step for step in steps if step[2] is None])
@@ -0,0 +1,57 @@
+# Stacked_Wings_Drag.py
+#
+# Created:  Oct 2026
+# Modified:
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.stacked_wings_drag import stacked_wings_drag, stack_wings
+
+# local imports
+from Aerodynamics import Aerodynamics
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Stacked_Wings_Drag(Aerodynamics):
+    """ SUAVE.Analyses.Aerodynamics.Stacked_Wings_Drag
+        parasite and compressibility drag of all the wings at once, in
+        place of Process_Geometry('wings') over parasite_drag_wing and
+        compressibility_drag_wing
+
+        The wing parameters are packed into arrays at initialize, every
+        evaluation is one (points x wings) pass. The per wing drag
+        breakdown entries are views into the stacked arrays.
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'stacked_wings_drag'
+
+        self.geometry = Data()
+        self.settings = Data()
+
+        # packed wing parameters, see stack_wings
+        self.stack = None
+
+
+    def initialize(self):
+
+        self.stack = stack_wings(self.geometry.wings)
+
+
+    def evaluate(self,state,settings,geometry):
+        """ process step, results = self.evaluate(state,settings,geometry)
+        """
+
+        if self.stack is None:
+            self.geometry = geometry
+            self.initialize()
+
+        return stacked_wings_drag(state,settings,self.stack)
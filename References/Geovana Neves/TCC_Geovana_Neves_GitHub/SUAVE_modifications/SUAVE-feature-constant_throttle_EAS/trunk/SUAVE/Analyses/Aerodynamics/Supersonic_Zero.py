@@ -61,6 +61,7 @@ class Supersonic_Zero(Markup):
         
         compute.lift = Process()
         compute.lift.inviscid_wings                = Vortex_Lattice()
+        compute.lift.inviscid_wings.training.mach_number = np.array([0.]) # wing_compressibility does it
         compute.lift.vortex                        = Methods.Lift.vortex_lift  # SZ
         compute.lift.compressible_wings            = Methods.Lift.wing_compressibility # SZ
         compute.lift.fuselage                      = Methods.Lift.fuselage_correction # difference in results storage
@@ -88,5 +89,6 @@ class Supersonic_Zero(Markup):
     def initialize(self):
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
         self.process.compute.lift.inviscid_wings.initialize()
+        self.compile_process()
         
     finalize = initialize        
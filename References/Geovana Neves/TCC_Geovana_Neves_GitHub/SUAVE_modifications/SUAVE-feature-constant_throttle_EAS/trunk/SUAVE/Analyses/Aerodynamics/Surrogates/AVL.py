@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
+import time
 
 from SUAVE.Core import Data, Units
 from SUAVE.Analyses.Aerodynamics.Aerodynamics import Aerodynamics
@@ -18,6 +19,9 @@ from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics\
 
 from SUAVE.Analyses import Surrogate
 
+from Surrogate_Store import Surrogate_Store
+from Grid_Surrogate  import Grid_Surrogate
+
 # ----------------------------------------------------------------------
 #  Analysis
 # ----------------------------------------------------------------------
@@ -26,12 +30,14 @@ class AVL(Aerodynamics,Surrogate):
     ''' This class only builds and evaluates an avl surrogate of aerodynamics
         It must be patched into a markup analysis if more fidelity is needed.
         The surrogate models lift coefficient, induced drag coefficient, and
-        pitching moment coefficient versus angle of attack.
+        pitching moment coefficient versus angle of attack and Mach number.
     '''
     def __defaults__(self):
         
         self.training = Data()
-        self.training.angle_of_attack  = np.array([-10.,0.,10.]) * Units.deg
+        self.training.angle_of_attack  = np.linspace(-10.,10.,9) * Units.deg
+        self.training.mach_number      = np.array([0.,0.3,0.5,0.7])
+        self.training.time             = 0.0
         self.training.lift_coefficient = None
         self.training.drag_coefficient = None
         self.training.pitch_moment_coefficient = None
@@ -46,6 +52,9 @@ class AVL(Aerodynamics,Surrogate):
         self.avl_callable.settings.filenames.run_folder = 'avl_surrogate_files'
         
         self.geometry = None
+
+        # training data of geometries already run
+        self.store = Surrogate_Store()
         
         self.finalized = False
         
@@ -55,12 +64,29 @@ class AVL(Aerodynamics,Surrogate):
     def finalize(self):
         
         if not self.finalized:
-            
-            print 'Building AVL Surrogate'
-            
-            self.avl_callable.features = self.geometry
-            self.avl_callable.finalize()
-            self.sample_training()
+
+            # the training depends on the aerodynamic geometry, not the mass
+            geometry = self.geometry
+            key = self.store.key('avl_surrogate',
+                                 geometry.wings,
+                                 geometry.fuselages,
+                                 geometry.reference_area,
+                                 geometry.mass_properties.center_of_gravity,
+                                 self.avl_callable.settings,
+                                 self.training.angle_of_attack,
+                                 self.training.mach_number)
+
+            training = self.store.load(key)
+            if training is None:
+                print 'Building AVL Surrogate'
+                self.avl_callable.features = self.geometry
+                self.avl_callable.finalize()
+                self.sample_training()
+                self.store.save(key,self.training)
+            else:
+                print 'Loading AVL Surrogate'
+                self.training.update(training)
+
             self.build_surrogate()
         
             self.finalized = True
@@ -77,24 +103,29 @@ class AVL(Aerodynamics,Surrogate):
         run_conditions = Aero_Conditions()
         ones_1col      = run_conditions.ones_row(1)
         run_conditions.weights.total_mass     = ones_1col*self.geometry.mass_properties.max_takeoff
-        run_conditions.freestream.mach_number = ones_1col * 0.0
         run_conditions.freestream.velocity    = ones_1col * 150 * Units.knots
         run_conditions.freestream.density     = ones_1col * 1.225
         run_conditions.freestream.gravity     = ones_1col * 9.81
         
-        # set up run cases
+        # set up run cases, every angle of attack at every Mach number
         alphas_1d = self.training.angle_of_attack
-        alphas    = alphas_1d.reshape([alphas_1d.shape[0],1])
-        run_conditions.expand_rows(alphas.shape[0])
-        run_conditions.aerodynamics.angle_of_attack = alphas
-
-        # run avl
+        machs_1d  = self.training.mach_number
+        shape     = [alphas_1d.shape[0],machs_1d.shape[0]]
+        alphas, machs = np.meshgrid(alphas_1d,machs_1d,indexing='ij')
+        run_conditions.expand_rows(alphas.size)
+        run_conditions.aerodynamics.angle_of_attack = alphas.reshape([-1,1])
+        run_conditions.freestream.mach_number       = machs.reshape([-1,1])
+
+        # run avl, all cases in one batch
+        t0 = time.time()
         results = self.avl_callable.evaluate_conditions(run_conditions)
-        self.training.lift_coefficient = results.aerodynamics.lift_coefficient.reshape(alphas_1d.shape)
+        self.training.time = time.time() - t0
+
+        self.training.lift_coefficient = results.aerodynamics.lift_coefficient.reshape(shape)
         self.training.induced_drag_coefficient = \
-            results.aerodynamics.drag_breakdown.induced.total.reshape(alphas_1d.shape)
+            results.aerodynamics.drag_breakdown.induced.total.reshape(shape)
         self.training.pitch_moment_coefficient = \
-            results.aerodynamics.pitch_moment_coefficient.reshape(alphas_1d.shape)
+            results.aerodynamics.pitch_moment_coefficient.reshape(shape)
 
         return
 
@@ -103,18 +134,22 @@ class AVL(Aerodynamics,Surrogate):
         
         # unpack
         training_data = self.training
-        AoA_data = training_data.angle_of_attack
-        CL_data  = training_data.lift_coefficient
-        CDi_data = training_data.induced_drag_coefficient
-        Cm_data  = training_data.pitch_moment_coefficient
+        AoA_data  = training_data.angle_of_attack
+        Mach_data = training_data.mach_number
+        CL_data   = training_data.lift_coefficient
+        CDi_data  = training_data.induced_drag_coefficient
+        Cm_data   = training_data.pitch_moment_coefficient
 
         # pack for surrogate
-        X_data = np.reshape(AoA_data,-1)
+        X_data = [AoA_data,Mach_data]
 
         # assign models
-        lift_model  = np.poly1d(np.polyfit(X_data,CL_data,1))
-        drag_model  = np.poly1d(np.polyfit(X_data,CDi_data,2))
-        pitch_model = np.poly1d(np.polyfit(X_data,Cm_data,1))
+        lift_model  = Grid_Surrogate()
+        drag_model  = Grid_Surrogate()
+        pitch_model = Grid_Surrogate()
+        lift_model.build (X_data,CL_data ,training_data.time)
+        drag_model.build (X_data,CDi_data,training_data.time)
+        pitch_model.build(X_data,Cm_data ,training_data.time)
 
         # populate surrogates
         self.surrogates.lift_coefficient = lift_model
@@ -128,12 +163,13 @@ class AVL(Aerodynamics,Surrogate):
         
         # unpack
         aoa           = state.conditions.aerodynamics.angle_of_attack
+        mach          = state.conditions.freestream.mach_number
         Sref          = self.geometry.reference_area
 
         # evaluate surrogates
-        CL  = self.surrogates.lift_coefficient(aoa)
-        CDi = self.surrogates.induced_drag_coefficient(aoa)
-        Cm  = self.surrogates.pitch_moment_coefficient(aoa)
+        CL  = self.surrogates.lift_coefficient(aoa,mach)
+        CDi = self.surrogates.induced_drag_coefficient(aoa,mach)
+        Cm  = self.surrogates.pitch_moment_coefficient(aoa,mach)
 
         # pack conditions
         state.conditions.aerodynamics.lift_coefficient = CL
@@ -156,10 +192,11 @@ class AVL(Aerodynamics,Surrogate):
         
         # unpack
         aoa   = state.conditions.aerodynamics.freestream.angle_of_attack
+        mach  = state.conditions.freestream.mach_number
         Sref  = self.geometry.reference_area
 
         # evaluate surrogates
-        CL  = self.surrogates.lift_coefficient(aoa)
+        CL  = self.surrogates.lift_coefficient(aoa,mach)
 
         # pack conditions
         state.conditions.aerodynamics.lift_coefficient = CL
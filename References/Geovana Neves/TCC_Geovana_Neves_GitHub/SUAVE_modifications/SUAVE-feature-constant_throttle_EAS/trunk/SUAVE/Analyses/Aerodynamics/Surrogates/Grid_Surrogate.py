@@ -0,0 +1,102 @@
+# Grid_Surrogate.py
+#
+# Created:  Oct 2026
+# Modified:
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import itertools
+import numpy as np
+
+from SUAVE.Core import Data
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Grid_Surrogate(Data):
+    """ SUAVE.Analyses.Aerodynamics.Surrogates.Grid_Surrogate
+        multilinear interpolation of a quantity sampled on a tensor grid,
+        e.g. angle of attack x Mach number (x Reynolds number)
+
+        this class is callable, see self.__call__
+    """
+
+    def __defaults__(self):
+        self.tag                 = 'grid_surrogate'
+        self.axes                = []   # sorted 1D sample points, one array per input
+        self.table               = None # samples, one dimension per axis
+        self.training_time       = 0.0  # seconds spent sampling the table
+        self.interpolation_error = None
+
+
+    def build(self,axes,table,training_time=0.0):
+        """ stores the grid and estimates the interpolation error
+
+            Inputs:
+                axes          - list of 1D arrays of sample points
+                table         - samples, table.shape == (len(axes[0]),len(axes[1]),...)
+                training_time - seconds spent sampling, reported only
+
+            Assumptions:
+                The error is estimated by predicting every interior sample
+                from its two neighbours along each axis, the largest miss is
+                kept. This is the error of a grid of half the resolution,
+                so an upper bound for smooth data.
+        """
+
+        self.axes          = [np.array(axis,dtype=float) for axis in axes]
+        self.table         = np.array(table,dtype=float)
+        self.training_time = training_time
+
+        error = 0.0
+        for k,x in enumerate(self.axes):
+            if len(x) < 3:
+                continue
+            v  = np.moveaxis(self.table,k,0)
+            t  = (x[1:-1] - x[:-2])/(x[2:] - x[:-2])
+            t  = t.reshape((-1,) + (1,)*(v.ndim-1))
+            v_hat = (1.-t)*v[:-2] + t*v[2:]
+            error = max(error,np.max(np.abs(v[1:-1] - v_hat)))
+
+        self.interpolation_error = error
+
+        return
+
+
+    def __call__(self,*inputs):
+        """ evaluates the surrogate, inputs broadcast against each other,
+            points outside the grid are held to its edges
+        """
+
+        inputs = np.broadcast_arrays(*[np.asarray(x,dtype=float) for x in inputs])
+        table  = self.table
+
+        # cell and weight along each axis, a single point axis is constant
+        index  = []
+        weight = []
+        for x_data,x in zip(self.axes,inputs):
+            if len(x_data) == 1:
+                index.append(np.zeros(x.shape,dtype=int))
+                weight.append(np.zeros(x.shape))
+                continue
+            x = np.clip(x,x_data[0],x_data[-1])
+            i = np.clip(np.searchsorted(x_data,x) - 1,0,len(x_data)-2)
+            index.append(i)
+            weight.append((x - x_data[i])/(x_data[i+1] - x_data[i]))
+
+        # sum over the corners of the cell
+        result = np.zeros(inputs[0].shape)
+        for corner in itertools.product((0,1),repeat=len(inputs)):
+            w   = np.ones(inputs[0].shape)
+            idx = []
+            for c,i,t,x_data in zip(corner,index,weight,self.axes):
+                w = w * (t if c else 1.-t)
+                idx.append(np.minimum(i+c,len(x_data)-1))
+            result += w*table[tuple(idx)]
+
+        return result
@@ -0,0 +1,100 @@
+# Surrogate_Store.py
+#
+# Created:  Oct 2026
+# Modified:
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.update_digest import update_digest
+from SUAVE.Methods.Utilities.cache_folder import cache_folder
+
+# training data already loaded or sampled, shared by every config in the process
+_surrogate_training = {}
+
+# fields that do not change the clean wing aerodynamics
+_skipped_fields = ['tag','flaps','slats','control_surfaces','high_lift','mass_properties',
+                   'filenames']
+
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Surrogate_Store(Data):
+    """ SUAVE.Analyses.Aerodynamics.Surrogates.Surrogate_Store
+        keeps surrogate training data keyed on a hash of the geometry and
+        settings it was sampled with, in memory and in a folder on disk
+
+        A config that only differs from another one by its flap deflection
+        or its mass gets the same key and reuses the training instead of
+        sampling its own. Surrogates are refit from the training on load.
+    """
+
+    def __defaults__(self):
+        self.tag    = 'surrogate_store'
+        self.folder = cache_folder('surrogates') # None keeps the data in memory only
+        self.hits   = 0
+        self.misses = 0
+
+
+    def key(self,*items):
+        """ digest of the items, Data and arrays are walked down to their
+            numbers, see SUAVE.Methods.Utilities.update_digest
+        """
+
+        sha = hashlib.sha1()
+        for item in items:
+            update_digest(sha,item,_skipped_fields)
+
+        return sha.hexdigest()
+
+
+    def load(self,key):
+        """ training data saved under key, or None
+        """
+
+        if key in _surrogate_training:
+            self.hits += 1
+            return _surrogate_training[key]
+
+        if self.folder is not None:
+            filename = os.path.join(self.folder,key + '.npz')
+            if os.path.exists(filename):
+                saved    = np.load(filename)
+                training = Data()
+                for name in saved.files:
+                    training[name] = saved[name]
+                _surrogate_training[key] = training
+                self.hits += 1
+                return training
+
+        self.misses += 1
+
+        return None
+
+
+    def save(self,key,training):
+        """ keeps the array fields of training under key
+        """
+
+        arrays = Data()
+        for name,value in training.items():
+            if value is not None:
+                arrays[name] = np.array(value)
+
+        _surrogate_training[key] = arrays
+
+        if self.folder is not None:
+            if not os.path.exists(self.folder):
+                os.makedirs(self.folder)
+            np.savez(os.path.join(self.folder,key + '.npz'),**arrays)
+
+        return
@@ -1,2 +1,4 @@
 
 from AVL import AVL
+from Surrogate_Store import Surrogate_Store
+from Grid_Surrogate import Grid_Surrogate
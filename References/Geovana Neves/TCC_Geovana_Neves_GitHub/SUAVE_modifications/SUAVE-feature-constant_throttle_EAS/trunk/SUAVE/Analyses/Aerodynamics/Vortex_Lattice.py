@@ -16,15 +16,18 @@ import SUAVE
 from SUAVE.Core import Data
 from SUAVE.Core import Units
 
-from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.weissinger_vortex_lattice_multi import weissinger_vortex_lattice_multi
 
 
 # local imports
 from Aerodynamics import Aerodynamics
+from SUAVE.Analyses.Aerodynamics.Surrogates.Surrogate_Store import Surrogate_Store
+from SUAVE.Analyses.Aerodynamics.Surrogates.Grid_Surrogate  import Grid_Surrogate
 
 
 # package imports
 import numpy as np
+import time
 
 
 # ----------------------------------------------------------------------
@@ -62,18 +65,39 @@ class Vortex_Lattice(Aerodynamics):
 
         # conditions table, used for surrogate model training
         self.training = Data()        
-        self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
+        self.training.angle_of_attack  = np.linspace(-10.,10.,21) * Units.deg
+        self.training.mach_number      = np.linspace(0.,0.8,9)
         self.training.lift_coefficient = None
+        self.training.time             = 0.0
         
         # surrogoate models
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
+
+        # training data of wing sets already sampled
+        self.store = Surrogate_Store()
  
         
     def initialize(self):
-                   
-        # sample training data
-        self.sample_training()
+
+        # the training only depends on the wings, the lattice and the angles
+        geometry = self.geometry
+        settings = self.settings
+        key = self.store.key(self.tag,
+                             geometry.wings,
+                             geometry.reference_area,
+                             settings.number_panels_spanwise,
+                             settings.number_panels_chordwise,
+                             self.training.angle_of_attack,
+                             self.training.mach_number)
+
+        # sample training data, unless an identical wing set already was
+        training = self.store.load(key)
+        if training is None:
+            self.sample_training()
+            self.store.save(key,self.training)
+        else:
+            self.training.update(training)
                     
         # build surrogate
         self.build_surrogate()
@@ -90,9 +114,13 @@ class Vortex_Lattice(Aerodynamics):
                 CD - array of drag coefficients, same size as alpha
 
             Assumptions:
-                linear intperolation surrogate model on Mach, Angle of Attack
-                    and Reynolds number
-                locations outside the surrogate's table are held to nearest data
+                linear intperolation surrogate model on Angle of Attack and Mach,
+                    the lattice is inviscid so there is no Reynolds number
+                locations outside the surrogate's table are held to nearest data,
+                    except above the highest trained Mach number, where the lift
+                    at that Mach number is scaled by the Prandtl-Glauert factor
+                    as wing_compressibility_correction does. With a single
+                    trained Mach number compressibility is left to the caller.
                 no changes to initial geometry or settings
         """
 
@@ -107,13 +135,22 @@ class Vortex_Lattice(Aerodynamics):
         
         q    = conditions.freestream.dynamic_pressure
         AoA  = conditions.aerodynamics.angle_of_attack
+        Mach = conditions.freestream.mach_number
         Sref = geometry.reference_area
         
         wings_lift_model = surrogates.lift_coefficient
         
-        # inviscid lift of wings only
-        inviscid_wings_lift                                        = wings_lift_model(AoA)
+        # inviscid lift of wings only, compressibility included
+        inviscid_wings_lift = wings_lift_model(AoA,Mach)
+        
+        # past the trained Mach numbers, follow the Prandtl-Glauert correction
+        Mach_data = self.training.mach_number
+        if len(Mach_data) > 1:
+            Mach_max = Mach_data[-1]
+            inviscid_wings_lift = inviscid_wings_lift * np.sqrt(1.-Mach_max**2)/np.sqrt(1.-np.maximum(Mach,Mach_max)**2)
+        
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift = inviscid_wings_lift
+        conditions.aerodynamics.lift_breakdown.compressible_wings  = inviscid_wings_lift
         state.conditions.aerodynamics.lift_coefficient             = inviscid_wings_lift
 
 
@@ -127,40 +164,43 @@ class Vortex_Lattice(Aerodynamics):
         settings = self.settings
         training = self.training
         
-        AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
+        AoA  = training.angle_of_attack
+        Mach = training.mach_number
+        CL   = np.zeros([len(AoA),len(Mach)])
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
+        konditions.freestream   = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
+        # all angles at once, one solve per wing and Mach number
+        konditions.aerodynamics.angle_of_attack = AoA
+
+        t0 = time.time()
+        for j,_ in enumerate(Mach):
+
+            konditions.freestream.mach_number = Mach[j]
             
             # these functions are inherited from Aerodynamics() or overridden
-            CL[i] = calculate_lift_vortex_lattice(konditions, settings, geometry)
+            CL[:,j] = calculate_lift_vortex_lattice(konditions, settings, geometry)
 
         # store training data
         training.lift_coefficient = CL
+        training.time             = time.time() - t0
 
         return
 
     def build_surrogate(self):
 
         # unpack data
-        training = self.training
-        AoA_data = training.angle_of_attack
-        CL_data  = training.lift_coefficient
+        training  = self.training
+        AoA_data  = training.angle_of_attack
+        Mach_data = training.mach_number
+        CL_data   = training.lift_coefficient
 
-        # pack for surrogate model
-        X_data = np.array([AoA_data]).T
-        X_data = np.reshape(X_data,-1)
-        
         # learn the model
-        cl_surrogate = np.poly1d(np.polyfit(X_data, CL_data ,1))
+        cl_surrogate = Grid_Surrogate()
+        cl_surrogate.build([AoA_data,Mach_data],CL_data,training.time)
 
         #Interpolation = Fidelity_Zero.Interpolation
         self.surrogates.lift_coefficient = cl_surrogate
@@ -175,17 +215,18 @@ class Vortex_Lattice(Aerodynamics):
 
 
 def calculate_lift_vortex_lattice(conditions,settings,geometry):
-    """ calculate total vehicle lift coefficient by vortex lattice
+    """ calculate total vehicle lift coefficient by vortex lattice,
+        for every angle of attack in the conditions at once
     """
 
     # unpack
     vehicle_reference_area = geometry.reference_area
 
     # iterate over wings
-    total_lift_coeff = 0.0
+    total_lift_coeff = np.zeros_like(np.atleast_1d(conditions.aerodynamics.angle_of_attack),dtype=float)
     for wing in geometry.wings.values():
 
-        [wing_lift_coeff,wing_drag_coeff] = weissinger_vortex_lattice(conditions,settings,wing)
+        wing_lift_coeff   = weissinger_vortex_lattice_multi(conditions,settings,wing)
         total_lift_coeff += wing_lift_coeff * wing.areas.reference / vehicle_reference_area
 
     return total_lift_coeff
@@ -1,11 +1,13 @@
 
 from Aerodynamics     import Aerodynamics
 from AVL              import AVL
+from AVL_Cache        import AVL_Cache
 from Fidelity_Zero    import Fidelity_Zero
 from Linear_Lift      import Linear_Lift
 from Markup           import Markup
 from Process_Geometry import Process_Geometry
 from Results          import Results
+from Stacked_Wings_Drag import Stacked_Wings_Drag
 from Supersonic_Zero  import Supersonic_Zero
 from Vortex_Lattice   import Vortex_Lattice
 from AERODAS          import AERODAS
@@ -8,8 +8,16 @@
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+import hashlib
+from copy import deepcopy
+from collections import OrderedDict
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import atleast_2d_col
 from SUAVE.Attributes.Atmospheres.Atmosphere import Atmosphere
 from SUAVE.Analyses import Analysis
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
 
 # ----------------------------------------------------------------------
@@ -22,7 +30,261 @@ class Atmospheric(Analysis):
     def __defaults__(self):
         atmo_data = Atmosphere()
         self.update(atmo_data)
-        
-        
+
+        # table mode, see build_table
+        self.settings.table_altitude    = None # defaults to the model range every 50 m
+        self.settings.table_temperature = np.linspace(-40.,40.,17) # delta isa
+        self.table = None
+
+        # plain float constants, see finalize
+        self.constants = None
+
+        # recent results keyed on the inputs, see cache_lookup
+        self.settings.cache_size      = 0 # off, e.g. 16 to keep the last 16 results
+        self.settings.cache_read_only = False # share read only arrays instead of copying
+        self.cache            = OrderedDict()
+        self.cache_table      = None
+        self.cache_statistics = Data()
+        self.cache_statistics.hits   = 0
+        self.cache_statistics.misses = 0
+
+
     def compute_values(self,altitude):
         raise NotImplementedError
+
+
+    def finalize(self):
+        """ Freezes the gas and planet constants used by compute_values
+
+        Inputs:
+            fluid_properties.gas_specific_constant
+            planet.sea_level_gravity, planet.mean_radius
+            breaks.altitude
+
+        Outputs:
+            constants, also stored in self.constants
+
+        Assumptions:
+            compute_values reads these instead of the gas and planet Data and
+            calls finalize itself the first time if needed. Call it again after
+            changing the gas, planet or breaks.
+        """
+
+        constants = Data()
+        constants.gravity      = float(self.planet.sea_level_gravity)
+        constants.radius       = float(self.planet.mean_radius)
+        constants.gas_constant = float(self.fluid_properties.gas_specific_constant)
+        constants.zmin         = float(self.breaks.altitude[0])
+        constants.zmax         = float(self.breaks.altitude[-1])
+
+        self.constants = constants
+        self.cache_clear()
+
+        return constants
+
+
+    def build_table(self):
+        """ Precomputes the atmosphere on an (altitude x temperature) grid
+
+        Inputs:
+            settings.table_altitude    : geometric altitudes (m)
+            settings.table_temperature : values of the second argument of compute_values,
+                                         the delta isa or the constant temperature (K)
+
+        Outputs:
+            table, also stored in self.table
+
+        Assumptions:
+            Once built, compute_values interpolates the table instead of running the
+            model, with the temperature argument given per point or as a scalar.
+            Pressure and density are interpolated in log, the rest linearly.
+            Set self.table back to None to return to the model, the result
+            cache notices the change and drops what the table gave.
+        """
+
+        altitude    = self.settings.table_altitude
+        temperature = np.array(self.settings.table_temperature,dtype=float)
+        if altitude is None:
+            # the breaks are geopotential, the table is in geometric altitude
+            Rad      = self.planet.mean_radius
+            zmin     = self.breaks.altitude[0]/(1. - self.breaks.altitude[0]/Rad)
+            zmax     = self.breaks.altitude[-1]/(1. - self.breaks.altitude[-1]/Rad)
+            altitude = np.linspace(zmin,zmax,int(np.ceil((zmax-zmin)/50.))+1)
+        altitude = np.array(altitude,dtype=float)
+
+        # run the model, one column of altitudes per temperature
+        self.table = None
+        values = np.zeros((5,len(altitude),len(temperature)))
+        for j,temperature_j in enumerate(temperature):
+            data = self.compute_values(altitude,temperature_j)
+            ones = np.ones_like(data.pressure)
+            values[0,:,j] = np.log(data.pressure[:,0])
+            values[1,:,j] = (data.temperature*ones)[:,0]
+            values[2,:,j] = np.log(data.density*ones)[:,0]
+            values[3,:,j] = (data.speed_of_sound*ones)[:,0]
+            values[4,:,j] = (data.dynamic_viscosity*ones)[:,0]
+
+        table = Data()
+        table.altitude    = altitude
+        table.temperature = temperature
+        table.properties  = values
+
+        self.table = table
+        self.cache_clear()
+
+        return table
+
+
+    def cache_lookup(self,altitude,temperature):
+        """ Looks up a recent compute_values result for the same inputs
+
+        Inputs:
+            altitude    : as given to compute_values
+            temperature : delta isa or constant temperature, as given to compute_values
+
+        Outputs:
+            key       : digest of the inputs, to pass to cache_store
+            atmo_data : the stored conditions, or None on a miss
+
+        Assumptions:
+            Segments at constant altitude ask for the same column on every
+            iteration. The cache is off by default, settings.cache_size turns
+            it on and the least recently used entry is dropped past it. Each
+            lookup costs a digest of the inputs, and each hit a copy unless
+            settings.cache_read_only is set, in which case the stored
+            conditions are shared with read only arrays. Check the hit and
+            miss counters before turning it on. Results are kept for one
+            table, setting another table or None empties the cache.
+            Complex inputs, as in a complex step derivative, bypass the cache.
+        """
+
+        if not self.settings.cache_size:
+            return None, None
+
+        # the key would have to carry the imaginary parts, and the derivative
+        # columns are different on every call anyway
+        if np.iscomplexobj(altitude) or np.iscomplexobj(temperature):
+            return None, None
+
+        # the results of another table, or of the model, do not apply
+        if self.cache_table is not self.table:
+            self.cache       = OrderedDict()
+            self.cache_table = self.table
+
+        cache = self.cache
+
+        altitude    = np.asarray(altitude,dtype=float)
+        temperature = np.asarray(temperature,dtype=float)
+
+        sha = hashlib.sha1()
+        sha.update(str((altitude.shape,temperature.shape)).encode('utf-8'))
+        sha.update(np.ascontiguousarray(altitude).tobytes())
+        sha.update(np.ascontiguousarray(temperature).tobytes())
+        key = sha.hexdigest()
+
+        if key not in cache:
+            self.cache_statistics.misses += 1
+            return key, None
+
+        # move to the most recent end
+        atmo_data = cache.pop(key)
+        cache[key] = atmo_data
+        self.cache_statistics.hits += 1
+
+        if not self.settings.cache_read_only:
+            atmo_data = deepcopy(atmo_data)
+
+        return key, atmo_data
+
+
+    def cache_store(self,key,atmo_data):
+        """ Stores the result of a cache_lookup miss and returns it
+        """
+
+        if key is None:
+            return atmo_data
+
+        cache = self.cache
+
+        if self.settings.cache_read_only:
+            for value in atmo_data.values():
+                if isinstance(value,np.ndarray):
+                    value.setflags(write=False)
+            cache[key] = atmo_data
+        else:
+            cache[key] = deepcopy(atmo_data)
+
+        while len(cache) > self.settings.cache_size:
+            cache.popitem(last=False)
+
+        return atmo_data
+
+
+    def cache_clear(self):
+        """ Empties the result cache and resets its counters
+        """
+
+        self.cache       = OrderedDict()
+        self.cache_table = self.table
+        self.cache_statistics.hits   = 0
+        self.cache_statistics.misses = 0
+
+
+    def interpolate_values(self,altitude,temperature):
+        """ Evaluates the table made by build_table
+
+        Inputs:
+            altitude    : geometric altitude (m), float, list or 1D array
+            temperature : delta isa or constant temperature (K), scalar or one per altitude
+
+        Outputs:
+            same conditions as compute_values
+
+        Assumptions:
+            Bilinear interpolation, points outside the table are held to its edges.
+        """
+
+        table = self.table
+
+        zs = atleast_2d_col(altitude)
+        ts = np.ones_like(zs) * atleast_2d_col(temperature)
+
+        p, T, rho, a, mew = interpolate_table(table.altitude,table.temperature,table.properties,zs,ts)
+
+        atmo_data = Conditions()
+        atmo_data.expand_rows(zs.shape[0])
+        atmo_data.pressure          = np.exp(p)
+        atmo_data.temperature       = T
+        atmo_data.density           = np.exp(rho)
+        atmo_data.speed_of_sound    = a
+        atmo_data.dynamic_viscosity = mew
+
+        return atmo_data
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def interpolate_table(x_data,y_data,values,x,y):
+    """ bilinear interpolation of a stack of (x,y) tables at the points (x,y)
+    """
+
+    x = np.clip(x,x_data[0],x_data[-1])
+    y = np.clip(y,y_data[0],y_data[-1])
+
+    # lower corner of the cell holding each point
+    i = np.clip(np.searchsorted(x_data,x) - 1,0,len(x_data)-2)
+    if len(y_data) > 1:
+        j  = np.clip(np.searchsorted(y_data,y) - 1,0,len(y_data)-2)
+        ty = (y - y_data[j])/(y_data[j+1] - y_data[j])
+        j1 = j + 1
+    else:
+        j  = np.zeros_like(i)
+        ty = np.zeros_like(x)
+        j1 = j
+
+    tx = (x - x_data[i])/(x_data[i+1] - x_data[i])
+
+    return ((1.-tx)*(1.-ty)*values[:,i,j]  + tx*(1.-ty)*values[:,i+1,j] +
+            (1.-tx)*ty     *values[:,i,j1] + tx*ty     *values[:,i+1,j1])
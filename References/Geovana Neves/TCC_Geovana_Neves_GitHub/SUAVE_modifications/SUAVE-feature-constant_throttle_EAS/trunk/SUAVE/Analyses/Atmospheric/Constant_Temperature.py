@@ -37,6 +37,22 @@ class Constant_Temperature(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.Constant_Temperature()
         self.update(atmo_data)        
+
+        # the table is over the constant temperature itself
+        self.settings.table_temperature = np.linspace(200.,330.,27)
+
+    def finalize(self):
+        """ Checks the gas and planet once and freezes the constants of the
+            model, see Atmospheric.finalize
+        """
+
+        # check properties
+        if not self.fluid_properties == Air():
+            warn('Constant_Temperature Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('Constant_Temperature Atmosphere not using Earth planet properties')
+
+        return Atmospheric.finalize(self)
     
     def compute_values(self,altitude,temperature=288.15):
 
@@ -61,26 +77,33 @@ class Constant_Temperature(Atmospheric):
           
         """
 
+        # freeze the constants first, finalize empties the result cache
+        constants = self.constants
+        if constants is None:
+            constants = self.finalize()
+
+        # reuse a recent result for the same inputs
+        key, atmo_data = self.cache_lookup(altitude,temperature)
+        if atmo_data is not None:
+            return atmo_data
+
+        # use the precomputed table if there is one
+        if self.table is not None:
+            return self.cache_store(key,self.interpolate_values(altitude,temperature))
+
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
-        gamma     = gas.gas_specific_constant
-        
-        # check properties
-        if not gas == Air():
-            warn('Constant_Temperature Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('Constant_Temperature Atmosphere not using Earth planet properties')          
+        grav      = constants.gravity
+        Rad       = constants.radius
+        gamma     = constants.gas_constant
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = constants.zmin
+        zmax = constants.zmax
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -137,7 +160,7 @@ class Constant_Temperature(Atmospheric):
         atmo_data.speed_of_sound    = a
         atmo_data.dynamic_viscosity = mew
         
-        return atmo_data
+        return self.cache_store(key,atmo_data)
 
 
 # ----------------------------------------------------------------------
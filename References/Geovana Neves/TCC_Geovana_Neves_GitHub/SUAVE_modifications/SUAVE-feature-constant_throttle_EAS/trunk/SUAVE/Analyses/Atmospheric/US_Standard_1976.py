@@ -37,6 +37,41 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+
+    def finalize(self):
+        """ Checks the gas and planet once and freezes the constants of the
+            model, including the per layer arrays, see Atmospheric.finalize
+        """
+
+        # check properties
+        if not self.fluid_properties == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')
+
+        constants = Atmospheric.finalize(self)
+        grav      = constants.gravity
+        gamma     = constants.gas_constant
+
+        # layer constants, one entry per layer
+        z_breaks = np.array(self.breaks.altitude,dtype=float)
+        T_breaks = np.array(self.breaks.temperature,dtype=float)
+        p_breaks = np.array(self.breaks.pressure,dtype=float)
+
+        alpha_layer = -(T_breaks[1:] - T_breaks[:-1])/(z_breaks[1:] - z_breaks[:-1])
+        isoth_layer = (alpha_layer == 0.)
+        expon_layer = grav/(np.where(isoth_layer,1.,alpha_layer)*gamma)
+        expon_layer[isoth_layer] = 0.
+
+        constants.z_breaks    = z_breaks
+        constants.z0_layer    = z_breaks[:-1]
+        constants.T0_layer    = T_breaks[:-1]
+        constants.p0_layer    = p_breaks[:-1]
+        constants.alpha_layer = alpha_layer
+        constants.isoth_layer = isoth_layer
+        constants.expon_layer = expon_layer
+
+        return constants
     
     def compute_values(self,altitude,temperature_deviation=0.0):
 
@@ -45,7 +80,7 @@ class US_Standard_1976(Atmospheric):
         Inputs:
             altitude     : geometric altitude (elevation) (m)
                            can be a float, list or 1D array of floats
-            temperature_deviation :  delta_isa
+            temperature_deviation :  delta_isa, scalar or one per altitude
          
         Outputs:
             list of conditions -
@@ -61,27 +96,35 @@ class US_Standard_1976(Atmospheric):
           
         """
 
+        # freeze the constants first, finalize empties the result cache
+        constants = self.constants
+        if constants is None:
+            constants = self.finalize()
+
+        # reuse a recent result for the same inputs
+        key, atmo_data = self.cache_lookup(altitude,temperature_deviation)
+        if atmo_data is not None:
+            return atmo_data
+
+        # use the precomputed table if there is one
+        if self.table is not None:
+            return self.cache_store(key,self.interpolate_values(altitude,temperature_deviation))
+
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
-        Rad       = self.planet.mean_radius
-        gamma     = gas.gas_specific_constant
+        grav      = constants.gravity
+        Rad       = constants.radius
+        gamma     = constants.gas_constant
         delta_isa = temperature_deviation
         
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
-        
         # convert input if necessary
-        zs = atleast_2d_col(zs)
+        zs        = atleast_2d_col(zs)
+        delta_isa = atleast_2d_col(delta_isa)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = constants.zmin
+        zmax = constants.zmax
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -94,35 +137,31 @@ class US_Standard_1976(Atmospheric):
             print "Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km"   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mew   = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in xrange( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
+        # layer constants, one entry per layer
+        z_breaks    = constants.z_breaks
+        z0_layer    = constants.z0_layer
+        T0_layer    = constants.T0_layer
+        p0_layer    = constants.p0_layer
+        alpha_layer = constants.alpha_layer
+        isoth_layer = constants.isoth_layer
+        expon_layer = constants.expon_layer
+
+        # find the layer of each altitude
+        # points on a break belong to the upper layer, values are the same at the edges
+        i_layer = np.searchsorted(z_breaks,zs,side='right') - 1
+        i_layer = np.clip(i_layer,0,len(z0_layer)-1)
+
+        z0    = z0_layer[i_layer]
+        T0    = T0_layer[i_layer]
+        p0    = p0_layer[i_layer]
+        alpha = alpha_layer[i_layer]
+
         # interpolate the breaks
         dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
-        
+        p  = p0 * np.where(isoth_layer[i_layer],
+                           np.exp(-1.*dz*grav/(gamma*T0)),
+                           (1.-alpha*dz/T0)**expon_layer[i_layer])
+
         T   = T0 - dz*alpha + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T)
@@ -136,7 +175,7 @@ class US_Standard_1976(Atmospheric):
         atmo_data.speed_of_sound    = a
         atmo_data.dynamic_viscosity = mew
         
-        return atmo_data
+        return self.cache_store(key,atmo_data)
 
 
 # ----------------------------------------------------------------------
@@ -10,6 +10,8 @@
 # ----------------------------------------------------------------------
 
 from SUAVE.Methods import Missions as Methods
+from SUAVE.Methods.Missions.Segments.converge_root_jacobian import converge_root_jacobian
+from SUAVE.Methods.Missions.Segments.Common import Warm_Start
 
 from Mission import Mission
 
@@ -24,6 +26,15 @@ class All_At_Once(Mission):
         
         self.tag = 'mission'
         
+        # root finder jacobian, see converge_root_jacobian
+        self.state.numerics.jacobian                    = None
+        self.state.numerics.jacobian_sparsity           = None
+        self.state.numerics.jacobian_sparsity_tolerance = 1e-3
+        
+        # seed the unknowns with the last solution, see Warm_Start
+        self.state.numerics.warm_start               = False
+        self.state.numerics.warm_start_extrapolation = False
+        
         # --------------------------------------------------------------
         #   The Solving Process
         # --------------------------------------------------------------
@@ -33,11 +44,13 @@ class All_At_Once(Mission):
         # --------------------------------------------------------------
         self.process.initialize.expand_state        = Methods.Segments.expand_state
         self.process.initialize.expand_sub_segments = Methods.Segments.Common.Sub_Segments.expand_sub_segments
+        self.process.initialize.warm_start          = Warm_Start.initialize_warm_start
 
         # --------------------------------------------------------------
         #   Converge
         # --------------------------------------------------------------
-        self.process.converge.converge_root         = Methods.Segments.converge_root
+        self.process.converge.converge_root         = converge_root_jacobian
+        self.process.converge.warm_start            = Warm_Start.update_warm_start
         
         # --------------------------------------------------------------
         #   Iterate
@@ -12,6 +12,12 @@ from SUAVE.Analyses.Mission.Segments import Simple
 from SUAVE.Analyses.Mission.Segments import Conditions
 
 from SUAVE.Methods.Missions import Segments as Methods
+from SUAVE.Methods.Missions.Segments.Common.Aerodynamics_Breakdown import update_aerodynamics_breakdown
+from SUAVE.Methods.Missions.Segments.Common.Propeller_Acoustics import update_propeller_acoustics
+from SUAVE.Methods.Missions.Segments.converge_root_jacobian import converge_root_jacobian
+from SUAVE.Methods.Missions.Segments.Common import Warm_Start
+from SUAVE.Methods.Missions.Segments.Common import Refinement
+from SUAVE.Methods.Missions.Segments.Common.Cached_Numerics import initialize_differentials_cached
 
 from SUAVE.Analyses import Process
 
@@ -41,6 +47,21 @@ class Aerodynamic(Simple):
         self.state.conditions.update( Conditions.Aerodynamics() )
         self.temperature_deviation = 0.0
         
+        # root finder jacobian, see converge_root_jacobian
+        self.state.numerics.jacobian                    = None
+        self.state.numerics.jacobian_sparsity           = None
+        self.state.numerics.jacobian_sparsity_tolerance = 1e-3
+        
+        # seed the unknowns with the last solution, see Warm_Start
+        self.state.numerics.warm_start               = False
+        self.state.numerics.warm_start_extrapolation = False
+        
+        # adaptive control points, see Refinement
+        self.state.numerics.maximum_control_points      = None
+        self.state.numerics.refinement_tolerance        = 1e-6
+        self.state.numerics.refinement_states           = ['weights.total_mass','propulsion.battery_energy','freestream.altitude']
+        self.state.numerics.keep_refined_control_points = False
+        
         # --------------------------------------------------------------
         #   The Solving Process
         # --------------------------------------------------------------
@@ -51,15 +72,18 @@ class Aerodynamic(Simple):
         initialize = self.process.initialize
         
         initialize.expand_state            = Methods.expand_state
-        initialize.differentials           = Methods.Common.Numerics.initialize_differentials_dimensionless
+        initialize.differentials           = initialize_differentials_cached
         initialize.conditions              = None        
+        initialize.warm_start              = Warm_Start.initialize_warm_start
         
         # --------------------------------------------------------------
         #   Converge - starts iteration
         # --------------------------------------------------------------
         converge = self.process.converge
         
-        converge.converge_root             = Methods.converge_root        
+        converge.converge_root             = converge_root_jacobian
+        converge.refinement                = Refinement.refine_control_points
+        converge.warm_start                = Warm_Start.update_warm_start
         
         # --------------------------------------------------------------
         #   Iterate - this is iterated
@@ -102,8 +126,10 @@ class Aerodynamic(Simple):
         
         # Post Processing
         finalize.post_process = Process()        
-        finalize.post_process.inertial_position = Methods.Common.Frames.integrate_inertial_horizontal_position
-        finalize.post_process.stability         = Methods.Common.Aerodynamics.update_stability
+        finalize.post_process.propeller_acoustics = update_propeller_acoustics
+        finalize.post_process.inertial_position   = Methods.Common.Frames.integrate_inertial_horizontal_position
+        finalize.post_process.aerodynamics        = update_aerodynamics_breakdown
+        finalize.post_process.stability           = Methods.Common.Aerodynamics.update_stability
         
         return
 
@@ -0,0 +1,7 @@
+# Airfoil_Polars/__init__.py
+#
+# Created:  Oct 2026
+# Modified:
+
+from import_airfoil_polars import import_airfoil_polars
+from compute_airfoil_polar_coefficients import compute_airfoil_polar_coefficients
@@ -0,0 +1,86 @@
+# compute_airfoil_polar_coefficients.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Compute Airfoil Polar Coefficients
+# ----------------------------------------------------------------------
+
+def compute_airfoil_polar_coefficients(tables,stations,alpha,Re):
+    """ SUAVE.Methods.Aerodynamics.Airfoil_Polars.compute_airfoil_polar_coefficients(tables,stations,alpha,Re)
+        section lift and drag coefficients from imported polar tables
+
+        Inputs:
+            tables   - list of tables from import_airfoil_polars, one per airfoil
+            stations - airfoil index of every entry, broadcastable against alpha
+            alpha    - section angle of attack [radians], any shape
+            Re       - section Reynolds number, same shape as alpha
+
+        Outputs:
+            Cl - section lift coefficient, same shape as alpha
+            Cd - section drag coefficient, same shape as alpha
+
+        Assumptions:
+            Bilinear interpolation in (log10 Re, alpha), held to the edges
+            of each table.
+    """
+
+    alpha = np.asarray(alpha)
+    logRe = np.log10(Re)
+
+    # the usual case, every station uses the same airfoil
+    if len(tables) == 1:
+        return interpolate_polar_table(tables[0],alpha,logRe)
+
+    stations = np.broadcast_to(stations,alpha.shape)
+
+    Cl = np.zeros_like(alpha)
+    Cd = np.zeros_like(alpha)
+    for i,table in enumerate(tables):
+        mask = (stations == i)
+        if np.any(mask):
+            Cl[mask], Cd[mask] = interpolate_polar_table(table,alpha[mask],logRe[mask])
+
+    return Cl, Cd
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def interpolate_polar_table(table,alpha,logRe):
+    """ bilinear lookup of lift and drag in one polar table
+    """
+
+    x_data = table.log_reynolds
+    y_data = table.angle_of_attack
+
+    x = np.clip(logRe,x_data[0],x_data[-1])
+    y = np.clip(alpha,y_data[0],y_data[-1])
+
+    # lower corner of the cell holding each point
+    i = np.clip(np.searchsorted(x_data,x) - 1,0,len(x_data)-2)
+    j = np.clip(np.searchsorted(y_data,y) - 1,0,len(y_data)-2)
+
+    tx = (x - x_data[i])/(x_data[i+1] - x_data[i])
+    ty = (y - y_data[j])/(y_data[j+1] - y_data[j])
+
+    w00 = (1.-tx)*(1.-ty)
+    w10 = tx*(1.-ty)
+    w01 = (1.-tx)*ty
+    w11 = tx*ty
+
+    CL = table.lift_coefficient
+    CD = table.drag_coefficient
+
+    Cl = w00*CL[i,j] + w10*CL[i+1,j] + w01*CL[i,j+1] + w11*CL[i+1,j+1]
+    Cd = w00*CD[i,j] + w10*CD[i+1,j] + w01*CD[i,j+1] + w11*CD[i+1,j+1]
+
+    return Cl, Cd
@@ -0,0 +1,138 @@
+# import_airfoil_polars.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.cache_folder import cache_folder as default_cache_folder
+
+import os
+import re
+import hashlib
+
+import numpy as np
+
+# parsed tables shared by every propeller, vehicle and config in the process
+_polar_tables = {}
+
+# ----------------------------------------------------------------------
+#  Import Airfoil Polars
+# ----------------------------------------------------------------------
+
+def import_airfoil_polars(polar_files,cache_folder=None):
+    """ SUAVE.Methods.Aerodynamics.Airfoil_Polars.import_airfoil_polars(polar_files,cache_folder=None)
+        builds a (log Re, alpha) table of section coefficients from XFOIL polars
+
+        Inputs:
+            polar_files  - list of XFOIL polar files of one airfoil, one per Reynolds number
+            cache_folder - where the binary table is kept, defaults to the
+                           'airfoil_polars' cache folder
+
+        Outputs:
+            table - Data() with fields
+                log_reynolds     - log10 of the Reynolds numbers, sorted
+                angle_of_attack  - union of the polar angles of attack [radians]
+                lift_coefficient - (Reynolds x alpha) array
+                drag_coefficient - (Reynolds x alpha) array
+
+        Assumptions:
+            The text files are parsed once and packed into a single .npy that is
+            memory mapped on later calls. The cache is keyed on the file paths,
+            sizes and modification times, so editing a polar rebuilds it.
+            Each polar is interpolated onto the common alpha axis and held at
+            its end values outside its own range.
+    """
+
+    if cache_folder is None:
+        cache_folder = default_cache_folder('airfoil_polars')
+
+    # key the cache on the files as they are on disk
+    sha = hashlib.sha1()
+    for polar_file in polar_files:
+        stat = os.stat(polar_file)
+        sha.update(os.path.abspath(polar_file).encode('utf-8'))
+        sha.update(str((stat.st_size,stat.st_mtime)).encode('utf-8'))
+
+    airfoil    = os.path.basename(polar_files[0]).split('_polar')[0]
+    cache_file = os.path.join(cache_folder,airfoil + '_polar_' + sha.hexdigest()[:16] + '.npy')
+
+    if cache_file in _polar_tables:
+        return _polar_tables[cache_file]
+
+    if not os.path.exists(cache_file):
+        packed = pack_polars([read_xfoil_polar(polar_file) for polar_file in polar_files])
+        if not os.path.exists(cache_folder):
+            os.makedirs(cache_folder)
+        np.save(cache_file,packed)
+
+    packed = np.load(cache_file,mmap_mode='r')
+
+    # unpack, these are views into the mapped file
+    table = Data()
+    table.log_reynolds     = packed[0,1:,0]
+    table.angle_of_attack  = packed[0,0,1:]
+    table.lift_coefficient = packed[0,1:,1:]
+    table.drag_coefficient = packed[1,1:,1:]
+
+    _polar_tables[cache_file] = table
+
+    return table
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def read_xfoil_polar(polar_file):
+    """ reads the Reynolds number and the alpha, CL, CD columns of an XFOIL polar
+    """
+
+    reynolds = None
+    rows     = []
+    in_table = False
+
+    with open(polar_file,'r') as f:
+        for line in f:
+            if reynolds is None and 'Re =' in line:
+                # e.g. "Mach =   0.000     Re =     0.050 e 6     Ncrit =   9.000"
+                match    = re.search(r'Re\s*=\s*([0-9.]+)\s*e\s*([0-9]+)',line)
+                reynolds = float(match.group(1)) * 10.**int(match.group(2))
+            elif line.strip().startswith('------'):
+                in_table = True
+            elif in_table and line.strip():
+                rows.append([float(value) for value in line.split()[:3]])
+
+    rows  = np.array(rows)
+    order = np.argsort(rows[:,0])
+
+    polar = Data()
+    polar.reynolds_number  = reynolds
+    polar.angle_of_attack  = np.radians(rows[order,0])
+    polar.lift_coefficient = rows[order,1]
+    polar.drag_coefficient = rows[order,2]
+
+    return polar
+
+
+def pack_polars(polars):
+    """ packs polars into one (2 x Reynolds+1 x alpha+1) array, the first row
+        and column of each slice hold the alpha and log10 Re axes
+    """
+
+    polars = sorted(polars,key=lambda polar: polar.reynolds_number)
+    alpha  = np.unique(np.concatenate([polar.angle_of_attack for polar in polars]))
+
+    packed = np.zeros((2,len(polars)+1,len(alpha)+1))
+    packed[:,0,0]  = np.nan
+    packed[:,0,1:] = alpha
+
+    for i,polar in enumerate(polars):
+        packed[:,i+1,0]  = np.log10(polar.reynolds_number)
+        packed[0,i+1,1:] = np.interp(alpha,polar.angle_of_attack,polar.lift_coefficient)
+        packed[1,i+1,1:] = np.interp(alpha,polar.angle_of_attack,polar.drag_coefficient)
+
+    return packed
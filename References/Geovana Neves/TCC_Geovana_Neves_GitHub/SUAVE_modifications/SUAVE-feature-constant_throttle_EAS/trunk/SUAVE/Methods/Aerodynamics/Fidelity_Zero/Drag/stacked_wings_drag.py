@@ -0,0 +1,220 @@
+# stacked_wings_drag.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Results
+
+# ----------------------------------------------------------------------
+#  Parasite and Compressibility Drag of All Wings
+# ----------------------------------------------------------------------
+
+def stacked_wings_drag(state,settings,stack):
+    """ SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.stacked_wings_drag(state,settings,stack)
+        parasite and compressibility drag of every wing in one pass
+
+        Inputs:
+            state.conditions.freestream.mach_number, density, dynamic_viscosity,
+                temperature, speed_of_sound
+            state.conditions.aerodynamics.lift_breakdown.compressible_wings
+            settings.wing_parasite_drag_form_factor
+            settings.recording_level - 'full' (default) or 'totals'
+            stack - packed wing parameters, see stack_wings
+
+        Outputs:
+            results - (points x wings) arrays, one column per wing in stack.tags
+
+            state.conditions.aerodynamics.drag_breakdown.parasite[wing.tag]
+            state.conditions.aerodynamics.drag_breakdown.compressible[wing.tag]
+                same entries as parasite_drag_wing and compressibility_drag_wing,
+                the arrays are column views into the results. With the 'totals'
+                recording level only the drag coefficients read by parasite_total
+                and compressibility_drag_wing_total are kept.
+
+        Assumptions:
+            Same correlations as parasite_drag_wing and compressibility_drag_wing,
+            with the transition points and the main wing lift taken per column.
+    """
+
+    # unpack
+    C              = settings.wing_parasite_drag_form_factor
+    full           = settings.get('recording_level','full') == 'full'
+    conditions     = state.conditions
+    freestream     = conditions.freestream
+    drag_breakdown = conditions.aerodynamics.drag_breakdown
+    wing_lifts     = conditions.aerodynamics.lift_breakdown.compressible_wings
+
+    Mc  = freestream.mach_number
+    roc = freestream.density
+    muc = freestream.dynamic_viscosity
+    Tc  = freestream.temperature
+    V   = Mc * freestream.speed_of_sound
+
+    cos_sweep = stack.cos_sweep[None,:]
+    t_c_w     = stack.thickness_to_chord[None,:]
+
+    # reynolds number, points x wings
+    Re_w = roc * V * stack.mean_aerodynamic_chord[None,:] / muc
+
+    # skin friction coefficient, upper and lower surfaces
+    cf_w_u, k_comp, k_reyn = compressible_mixed_flat_plate_stacked(Re_w,Mc,Tc,stack.transition_x_upper)
+    cf_w_l, k_comp, k_reyn = compressible_mixed_flat_plate_stacked(Re_w,Mc,Tc,stack.transition_x_lower)
+
+    # correction for airfoils
+    k_w = 1. + ( 2.* C * (t_c_w * cos_sweep**2.) ) / ( np.sqrt(1.- Mc**2. * cos_sweep**2.) )  \
+        + ( C**2. * cos_sweep**2. * t_c_w**2. * (1. + 5.*cos_sweep**2.) ) \
+        / (2.*(1.-(Mc*cos_sweep)**2.))
+
+    # parasite drag on the wing reference areas
+    area_ratio         = (stack.affected_area/stack.reference_area)[None,:]
+    wing_parasite_drag = k_w * cf_w_u * area_ratio /2. + k_w * cf_w_l * area_ratio /2.
+
+    # only the main wing carries the vortex lattice lift
+    cl_w = wing_lifts * stack.main_wing[None,:]
+
+    # effective thickness and lift normal to the sweep
+    tc = t_c_w / cos_sweep
+    cl = cl_w / (cos_sweep*cos_sweep)
+
+    # compressibility drag based on regressed fits from AA241
+    mcc_cos_ws = 0.922321524499352       \
+               - 1.153885166170620*tc    \
+               - 0.304541067183461*cl    \
+               + 0.332881324404729*tc*tc \
+               + 0.467317361111105*tc*cl \
+               + 0.087490431201549*cl*cl
+
+    # crest-critical mach number, corrected for wing sweep
+    mcc  = mcc_cos_ws / cos_sweep
+
+    # compressibility correlation, Shevell
+    mo_mc      = Mc/mcc
+    dcdc_cos3g = 0.0019*mo_mc**14.641
+    cd_c       = dcdc_cos3g * cos_sweep*cos_sweep*cos_sweep
+
+    # the coefficients are all the totals need
+    if not full:
+        results = Results()
+        results.tags                      = stack.tags
+        results.parasite_drag_coefficient = wing_parasite_drag
+        results.compressibility_drag      = cd_c
+
+        for i,tag in enumerate(stack.tags):
+            column = slice(i,i+1)
+            drag_breakdown.parasite[tag]     = Results( parasite_drag_coefficient = wing_parasite_drag[:,column] )
+            drag_breakdown.compressible[tag] = Results( compressibility_drag      = cd_c[:,column]               )
+
+        return results
+
+    # divergence mach number
+    MDiv = mcc * ( 1.02 + 0.08*(1 - cos_sweep) )
+
+    # pack the stacked arrays
+    results = Results()
+    results.tags                      = stack.tags
+    results.parasite_drag_coefficient = wing_parasite_drag
+    results.skin_friction_coefficient = (cf_w_u+cf_w_l)/2.
+    results.form_factor               = k_w
+    results.reynolds_factor           = k_reyn
+    results.compressibility_factor    = k_comp
+    results.compressibility_drag      = cd_c
+    results.crest_critical            = mcc
+    results.divergence_mach           = MDiv
+
+    # per wing entries, column views into the stacked arrays
+    for i,tag in enumerate(stack.tags):
+        column = slice(i,i+1)
+
+        drag_breakdown.parasite[tag] = Results(
+            wetted_area               = stack.affected_area[i]      ,
+            reference_area            = stack.reference_area[i]     ,
+            parasite_drag_coefficient = wing_parasite_drag[:,column] ,
+            skin_friction_coefficient = results.skin_friction_coefficient[:,column] ,
+            compressibility_factor    = k_comp                       ,
+            reynolds_factor           = k_reyn[:,column]             ,
+            form_factor               = k_w[:,column]                ,
+        )
+
+        drag_breakdown.compressible[tag] = Results(
+            compressibility_drag      = cd_c[:,column]               ,
+            thickness_to_chord        = tc[0,i]                      ,
+            wing_sweep                = stack.sweep[i]               ,
+            crest_critical            = mcc[:,column]                ,
+            divergence_mach           = MDiv[:,column]               ,
+        )
+
+    return results
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def stack_wings(wings):
+    """ packs the drag parameters of the wings into arrays, one entry per
+        wing in the order of wings.values()
+    """
+
+    wings = list(wings.values())
+
+    stack = Data()
+    stack.tags                   = [wing.tag for wing in wings]
+    stack.thickness_to_chord     = np.array([wing.thickness_to_chord        for wing in wings],dtype=float)
+    stack.sweep                  = np.array([wing.sweeps.quarter_chord      for wing in wings],dtype=float)
+    stack.mean_aerodynamic_chord = np.array([wing.chords.mean_aerodynamic   for wing in wings],dtype=float)
+    stack.reference_area         = np.array([wing.areas.reference           for wing in wings],dtype=float)
+    stack.affected_area          = np.array([wing.areas.affected            for wing in wings],dtype=float)
+    stack.transition_x_upper     = np.array([wing.transition_x_upper        for wing in wings],dtype=float)
+    stack.transition_x_lower     = np.array([wing.transition_x_lower        for wing in wings],dtype=float)
+    stack.main_wing              = np.array([wing.tag == 'main_wing'        for wing in wings],dtype=float)
+    stack.cos_sweep              = np.cos(stack.sweep)
+
+    transition = np.hstack([stack.transition_x_upper,stack.transition_x_lower])
+    if np.any(transition < 0.0) or np.any(transition > 1.0):
+        raise ValueError("Boundary layer transition must be between 0 and 1")
+
+    return stack
+
+
+def compressible_mixed_flat_plate_stacked(Re,Ma,Tc,xt):
+    """ compressible_mixed_flat_plate with one transition point per column,
+        Re is points x wings, Ma and Tc are points x 1, xt has one entry per wing
+    """
+
+    laminar = xt > 0.0
+
+    # laminar run, guarded for the fully turbulent wings
+    Rex = Re*xt
+    Rex[Rex == 0.0] = 0.0001
+
+    theta = 0.671*xt/np.sqrt(Rex)
+    xeff  = (27.78*theta*Re**0.2)**1.25
+    Rext  = Re*(1-xt+xeff)
+
+    cf_turb  = 0.455/(np.log10(Rext)**2.58)
+    cf_lam   = 1.328/np.sqrt(Rex)
+    cf_start = np.zeros_like(Re)
+    cf_start[:,laminar] = 0.455/(np.log10(Re[:,laminar]*xeff[:,laminar])**2.58)
+
+    cf_inc = cf_lam*xt + cf_turb*(1-xt+xeff) - cf_start*xeff
+
+    # compressibility correction
+    Tw = Tc * (1. + 0.178*Ma**2.)
+    Td = Tc * (1. + 0.035*Ma**2. + 0.45*(Tw/Tc - 1.))
+    k_comp = (Tc/Td)
+
+    # reynolds correction
+    Rd_w   = Re * (Td/Tc)**1.5 * ( (Td+216.) / (Tc+216.) )
+    k_reyn = (Re/Rd_w)**0.2
+
+    # apply corrections
+    cf = cf_inc * k_comp * k_reyn
+
+    return cf, k_comp, k_reyn
@@ -0,0 +1,64 @@
+# thrust_axis_velocity.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# thrust axes already built, keyed by thrust angle
+_thrust_axes = {}
+
+# ----------------------------------------------------------------------
+#  Thrust Axis Velocity
+# ----------------------------------------------------------------------
+
+def thrust_axis_velocity(conditions,thrust_angle):
+    """ SUAVE.Methods.Geometry.Three_Dimensional.thrust_axis_velocity(conditions,thrust_angle)
+        freestream velocity along the axis of a propulsor
+
+        Inputs:
+            conditions.frames.inertial.velocity_vector   - (N x 3) [m/s]
+            conditions.frames.body.transform_to_inertial - (N x 3 x 3)
+            thrust_angle                                 - propulsor incidence [radians]
+
+        Outputs:
+            V - (N x 1) velocity along the thrust axis [m/s]
+
+        Assumptions:
+            Same result as rotating the inertial velocity to the body frame and
+            then to the thrust frame and keeping the first component, done as
+            one contraction without building the (N x 3 x 3) thrust transforms.
+    """
+
+    Vv              = conditions.frames.inertial.velocity_vector
+    T_body2inertial = conditions.frames.body.transform_to_inertial
+
+    axis = thrust_axis(thrust_angle)
+
+    # V_body = T_body2inertial^T Vv, then project onto the thrust axis
+    V = np.einsum('kji,kj,i->k',T_body2inertial,Vv,axis)
+
+    return V[:,None]
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def thrust_axis(thrust_angle):
+    """ body frame unit vector of the thrust axis, the first column of the
+        body to thrust rotation, cached per angle
+    """
+
+    theta = float(thrust_angle)
+
+    if theta not in _thrust_axes:
+        axis = np.array([np.cos(theta), 0., -np.sin(theta)])
+        axis.setflags(write=False)
+        _thrust_axes[theta] = axis
+
+    return _thrust_axes[theta]
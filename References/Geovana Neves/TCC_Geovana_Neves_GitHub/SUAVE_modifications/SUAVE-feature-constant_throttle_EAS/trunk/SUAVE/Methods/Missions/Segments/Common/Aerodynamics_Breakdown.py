@@ -0,0 +1,35 @@
+# Aerodynamics_Breakdown.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Update Aerodynamics Breakdown
+# ----------------------------------------------------------------------
+
+def update_aerodynamics_breakdown(segment,state):
+    """ SUAVE.Methods.Missions.Segments.Common.Aerodynamics_Breakdown.update_aerodynamics_breakdown(segment,state)
+        records the full lift and drag breakdowns of the converged state
+
+        Inputs:
+            segment.analyses.aerodynamics
+            state.conditions
+
+        Outputs:
+            state.conditions.aerodynamics.lift_breakdown
+            state.conditions.aerodynamics.drag_breakdown
+
+        Assumptions:
+            Only runs for an aerodynamics analysis with the 'totals'
+            recording level, whose steps skipped the component records
+            while iterating. The totals are unchanged.
+    """
+
+    aerodynamics_model = segment.analyses.aerodynamics
+
+    if aerodynamics_model.settings.get('recording_level','full') == 'full':
+        return
+
+    aerodynamics_model.record_breakdown(state)
+
+    return
@@ -0,0 +1,56 @@
+# Cached_Numerics.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# control points, differentiation and integration matrices keyed on the
+# number of control points and the discretization method, shared by every
+# segment and evaluation in the process
+_numerics_cache = {}
+
+# ----------------------------------------------------------------------
+#  Initialize Differentials, Cached
+# ----------------------------------------------------------------------
+
+def initialize_differentials_cached(segment,state):
+    """ SUAVE.Methods.Missions.Segments.Common.Cached_Numerics.initialize_differentials_cached(segment,state)
+        initialize_differentials_dimensionless, reusing the matrices of any
+        segment with the same number of control points and discretization
+
+        Inputs:
+            state.numerics.number_control_points
+            state.numerics.discretization_method
+
+        Outputs:
+            state.numerics.dimensionless.control_points
+            state.numerics.dimensionless.differentiate
+            state.numerics.dimensionless.integrate
+
+        Assumptions:
+            The discretization only depends on the number of points. The arrays
+            are shared, so they are read only, a step changing them in place
+            fails instead of changing them for every segment.
+    """
+
+    # unpack
+    numerics              = state.numerics
+    N                     = numerics.number_control_points
+    discretization_method = numerics.discretization_method
+
+    key = (N,discretization_method)
+
+    if key not in _numerics_cache:
+        # get information from spectral method
+        x,D,I = discretization_method(N,**numerics)
+        for array in (x,D,I):
+            array.setflags(write=False)
+        _numerics_cache[key] = (x,D,I)
+
+    x,D,I = _numerics_cache[key]
+
+    # pack
+    numerics.dimensionless.control_points = x
+    numerics.dimensionless.differentiate  = D
+    numerics.dimensionless.integrate      = I
+
+    return
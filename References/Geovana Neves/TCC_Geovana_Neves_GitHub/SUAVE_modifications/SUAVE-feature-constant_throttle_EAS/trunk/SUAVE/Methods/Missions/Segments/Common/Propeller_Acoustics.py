@@ -0,0 +1,62 @@
+# Propeller_Acoustics.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Update Propeller Acoustics
+# ----------------------------------------------------------------------
+
+def update_propeller_acoustics(segment,state):
+    """ SUAVE.Methods.Missions.Segments.Common.Propeller_Acoustics.update_propeller_acoustics(segment,state)
+        stores the propeller acoustic outputs of the converged segment
+
+        Inputs:
+            segment.analyses.energy.network
+            state.unknowns
+
+        Outputs:
+            state.conditions.propulsion.acoustic_outputs
+
+        Assumptions:
+            Only runs for a network with a propeller whose acoustic_capture is
+            'final', see Propeller.spin_acoustics. The iterate process is run
+            once at the converged unknowns, so the propeller inputs and the
+            conditions belong to the solution and not to the last residual
+            evaluation of the root finder.
+    """
+
+    propellers = [propeller for propeller in find_propellers(segment) if propeller.acoustic_capture == 'final']
+
+    if not propellers:
+        return
+
+    segment.process.iterate(segment,state)
+
+    for propeller in propellers:
+        propeller.spin_acoustics(state.conditions,propeller.get('variable_pitch',False))
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def find_propellers(segment):
+    """ components of the segment energy network that have spin_acoustics,
+        directly on the network or in one of its containers
+    """
+
+    energy = segment.analyses.get('energy',None)
+    if energy is None or energy.get('network',None) is None:
+        return []
+
+    components = []
+    for component in energy.network.values():
+        if hasattr(component,'spin_acoustics'):
+            components.append(component)
+        elif isinstance(component,dict):
+            components.extend([item for item in component.values() if hasattr(item,'spin_acoustics')])
+
+    return components
@@ -0,0 +1,177 @@
+# Refinement.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from numpy.polynomial import chebyshev
+from copy import deepcopy
+
+from SUAVE.Methods.Missions.Segments.Common.Warm_Start import keep_warm_start_solution
+
+# ----------------------------------------------------------------------
+#  Refine Control Points
+# ----------------------------------------------------------------------
+
+def refine_control_points(segment,state):
+    """ SUAVE.Methods.Missions.Segments.Common.Refinement.refine_control_points(segment,state)
+        solves the segment again on more control points while the converged
+        states are not resolved, after converge_root
+
+        Inputs:
+            state.numerics.maximum_control_points - None for no refinement
+            state.numerics.refinement_tolerance   - largest relative discretization error
+            state.numerics.refinement_states      - paths in the conditions of the
+                                                    states to check, missing ones are skipped
+            state.numerics.keep_refined_control_points - True to set the refined number
+                                                    on the segment
+            state.numerics.number_control_points
+            state.numerics.dimensionless.control_points
+            state.numerics.converged
+
+        Outputs:
+            state.numerics.number_control_points
+            state.numerics.discretization_error
+            state.unknowns and conditions on the refined control points
+            segment.state.numerics.number_control_points - the refined number, for the
+                                                           next evaluations, if kept
+            segment.warm_start_solutions                 - the coarse solution, if the
+                                                           refined number is not kept
+
+        Assumptions:
+            The error of a state is the size of its last two Chebyshev
+            coefficients relative to its range over the segment. A segment over
+            tolerance goes from n to 2n-1 control points, which keeps the
+            Chebyshev points, up to the maximum. The initialize process is run
+            again for the new points without the warm start, with the unknowns
+            interpolated from the coarse solution as the initial guess. That
+            run sets numerics.default_unknowns to None, the fine guesses are
+            not seeded. If the refined segment does not converge, the
+            converged coarse state, its default_unknowns included, is put back.
+            With keep_refined_control_points the refined number is set on the
+            segment, so the next evaluations solve on it from the start and are
+            warm started there. Otherwise every evaluation starts on the number
+            of points of the segment and refines again, and the converged
+            coarse unknowns are kept for the warm start of that first solve.
+    """
+
+    numerics = state.numerics
+
+    if numerics.maximum_control_points is None:
+        return
+
+    keep_refinement = numerics.get('keep_refined_control_points',False)
+    n_start         = numerics.number_control_points
+
+    while numerics.converged:
+
+        error = discretization_error(state)
+        numerics.discretization_error = error
+
+        n_coarse = numerics.number_control_points
+        if error <= numerics.refinement_tolerance or n_coarse >= numerics.maximum_control_points:
+            break
+
+        coarse   = keep_state(state)
+        x_coarse = np.ravel(numerics.dimensionless.control_points).copy()
+
+        # the next evaluation starts on these points again
+        if numerics.get('warm_start',False) and not keep_refinement and n_coarse == n_start:
+            keep_warm_start_solution(segment,state)
+
+        # new points, then the coarse solution as the guess
+        numerics.number_control_points = min(2*n_coarse - 1,numerics.maximum_control_points)
+        warm_start = numerics.get('warm_start',False)
+        numerics.warm_start = False
+        try:
+            segment.process.initialize(segment,state)
+        finally:
+            numerics.warm_start = warm_start
+
+        x_fine = np.ravel(numerics.dimensionless.control_points)
+        interpolate_unknowns(coarse['unknowns'],state.unknowns,x_coarse,x_fine)
+
+        segment.process.converge.converge_root(segment,state)
+
+        if not numerics.converged:
+            for key, value in coarse.items():
+                state[key] = value
+            break
+
+    if keep_refinement and 'state' in segment and numerics.converged:
+        segment.state.numerics.number_control_points = numerics.number_control_points
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def discretization_error(state):
+    """ largest size of the last two Chebyshev coefficients of the refinement
+        states, relative to the range of each state
+
+        States that do not change over the segment are measured against the
+        square root of machine precision times their size instead, so their
+        round off is not taken for an error.
+    """
+
+    x     = 2.*np.ravel(state.numerics.dimensionless.control_points) - 1.
+    n     = len(x)
+    error = 0.
+
+    for path in state.numerics.refinement_states:
+
+        value = state.conditions
+        for key in path.split('.'):
+            value = value[key] if key in value else None
+            if value is None:
+                break
+
+        if value is None or np.shape(value)[0] != n:
+            continue
+
+        coefficients = np.abs(chebyshev.chebfit(x,value,n-1))
+        scale        = max(np.max(np.ptp(value,axis=0)),np.sqrt(np.finfo(float).eps)*np.max(np.abs(value)))
+        if scale > 0.:
+            error = max(error,np.max(coefficients[-2:])/scale)
+
+    return error
+
+
+def keep_state(state):
+    """ copy of the items of the state, sharing the initials, which belong to
+        the previous segment
+    """
+
+    kept = {}
+    for key, value in state.items():
+        kept[key] = value if key == 'initials' else deepcopy(value)
+
+    return kept
+
+
+def interpolate_unknowns(coarse,fine,x_coarse,x_fine):
+    """ fills the unknowns on the fine points from the coarse ones, by the
+        Chebyshev series through the coarse points
+    """
+
+    for key, value in coarse.items():
+
+        if key not in fine:
+            continue
+
+        if isinstance(value,np.ndarray):
+            if value.ndim == 2 and value.shape[0] == len(x_coarse):
+                coefficients = chebyshev.chebfit(2.*x_coarse-1.,value,len(x_coarse)-1)
+                fine[key]    = chebyshev.chebval(2.*x_fine-1.,coefficients).T
+
+        elif hasattr(value,'items'):
+            interpolate_unknowns(value,fine[key],x_coarse,x_fine)
+
+    return
@@ -0,0 +1,111 @@
+# Warm_Start.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Initialize Warm Start
+# ----------------------------------------------------------------------
+
+def initialize_warm_start(segment,state):
+    """ SUAVE.Methods.Missions.Segments.Common.Warm_Start.initialize_warm_start(segment,state)
+        seeds the unknowns with the last converged solution of the segment
+
+        Inputs:
+            state.numerics.warm_start               - True to seed
+            state.numerics.warm_start_extrapolation - True to extrapolate linearly
+                                                      from the last two solutions
+            segment.warm_start_solutions            - last converged unknowns, packed
+            state.unknowns, the default guesses
+
+        Outputs:
+            state.unknowns
+            state.numerics.default_unknowns - the default guesses, packed, or None
+                                              if the unknowns were not seeded
+
+        Assumptions:
+            Solutions are kept on the segment object, so missions built side
+            by side with the same segment tags do not share them. A solution
+            with another number of unknowns is not used. Run after
+            expand_state, so the defaults are one row per control point.
+    """
+
+    state.numerics.default_unknowns = None
+
+    if not state.numerics.warm_start:
+        return
+
+    solutions = segment.get('warm_start_solutions',[])
+    defaults  = state.unknowns.pack_array()
+
+    solutions = [x for x in solutions if len(x) == len(defaults)]
+    if not solutions:
+        return
+
+    unknowns = solutions[-1]
+    if state.numerics.warm_start_extrapolation and len(solutions) > 1:
+        unknowns = 2.*solutions[-1] - solutions[-2]
+
+    state.numerics.default_unknowns = defaults
+    state.unknowns.unpack_array(unknowns.copy())
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Update Warm Start
+# ----------------------------------------------------------------------
+
+def update_warm_start(segment,state):
+    """ SUAVE.Methods.Missions.Segments.Common.Warm_Start.update_warm_start(segment,state)
+        keeps the converged unknowns for the next evaluation, after converge_root
+
+        Inputs:
+            state.numerics.converged
+            state.numerics.default_unknowns
+            state.unknowns
+
+        Outputs:
+            segment.warm_start_solutions - the last two converged unknowns
+
+        Assumptions:
+            A warm started segment that did not converge is solved again from
+            the default guesses, with the root finder of the segment. Only
+            converged solutions are kept.
+    """
+
+    if not state.numerics.warm_start:
+        return
+
+    if not state.numerics.converged and state.numerics.default_unknowns is not None:
+        state.unknowns.unpack_array(state.numerics.default_unknowns)
+        state.numerics.default_unknowns = None
+        segment.process.converge.converge_root(segment,state)
+
+    if not state.numerics.converged:
+        return
+
+    keep_warm_start_solution(segment,state)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def keep_warm_start_solution(segment,state):
+    """ adds the unknowns of the state to the last two solutions of the segment
+    """
+
+    solutions = segment.get('warm_start_solutions',[]) + [state.unknowns.pack_array().copy()]
+    segment.warm_start_solutions = solutions[-2:]
+
+    return
+
@@ -0,0 +1,382 @@
+# converge_root_jacobian.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.optimize
+import warnings
+from copy import deepcopy
+from warnings import warn
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+
+# ----------------------------------------------------------------------
+#  Converge Root with a Jacobian
+# ----------------------------------------------------------------------
+
+def converge_root_jacobian(segment,state):
+    """ SUAVE.Methods.Missions.Segments.converge_root_jacobian(segment,state)
+        solves the segment residuals for the unknowns, with a Jacobian given
+        to the root finder as fprime
+
+        Inputs:
+            state.unknowns, state.residuals
+            state.numerics.tolerance_solution
+            state.numerics.jacobian - None, the root finder differences the
+                                      residuals itself
+                                    - 'complex_step', see complex_step_jacobian
+                                    - 'colored_finite_difference', see
+                                      colored_finite_difference_jacobian
+                                    - a function(unknowns,segment,state)
+                                      returning d(residuals)/d(unknowns)
+
+        Outputs:
+            state.unknowns, state.residuals and the conditions at the solution
+            state.numerics.converged
+
+        Assumptions:
+            The Jacobian columns are evaluated on a copy of the state, so the
+            state only ever holds the root finder's own iterates. fsolve
+            calls fprime once at the initial guess to check it before using
+            it there, the second call reuses the first Jacobian. The state
+            ends at the solution fsolve returns, evaluated again if that was
+            not the last point tried.
+    """
+
+    unknowns = state.unknowns.pack_array()
+
+    if state.numerics.jacobian is None:
+        fprime = None
+    else:
+        fprime = reuse_last_jacobian(jacobian)
+
+    unknowns,infodict,ier,msg = scipy.optimize.fsolve( iterate,
+                                                        unknowns,
+                                                        args        = (segment,state),
+                                                        fprime      = fprime,
+                                                        xtol        = state.numerics.tolerance_solution,
+                                                        full_output = 1)
+
+    # the state holds the last point evaluated, make it the solution
+    if not np.array_equal(state.unknowns.pack_array(),unknowns):
+        iterate(unknowns,segment,state)
+
+    state.numerics.converged = (ier == 1)
+
+    if ier!=1:
+        print "Segment did not converge. Segment Tag: " + segment.tag
+        print "Error Message:\n" + msg
+
+    return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def iterate(unknowns,segment,state):
+    """ residuals of the segment at the unknowns
+    """
+
+    if isinstance(unknowns,array_type):
+        # the root finder writes over its array later, keep a copy
+        state.unknowns.unpack_array(np.array(unknowns))
+    else:
+        state.unknowns = unknowns
+
+    segment.process.iterate(segment,state)
+
+    residuals = state.residuals.pack_array()
+
+    return residuals
+
+
+def jacobian(unknowns,segment,state):
+    """ d(residuals)/d(unknowns) by the method in state.numerics.jacobian
+    """
+
+    method = state.numerics.jacobian
+
+    if callable(method):
+        return method(unknowns,segment,state)
+
+    elif method == 'complex_step':
+        return complex_step_jacobian(unknowns,segment,state)
+
+    elif method == 'colored_finite_difference':
+        return colored_finite_difference_jacobian(unknowns,segment,state)
+
+    raise ValueError("unknown segment jacobian method '%s'" % method)
+
+
+def reuse_last_jacobian(function):
+    """ function(unknowns,segment,state) that gives the previous Jacobian
+        again when called twice in a row at the same unknowns
+    """
+
+    last = Data()
+    last.unknowns = None
+    last.jacobian = None
+
+    def reused(unknowns,segment,state):
+        unknowns = np.array(unknowns,dtype=float)
+        if last.unknowns is None or not np.array_equal(unknowns,last.unknowns):
+            last.jacobian = np.array(function(unknowns,segment,state))
+            last.unknowns = unknowns
+        # the root finder may factor the Jacobian in place
+        return last.jacobian.copy()
+
+    return reused
+
+
+def complex_step_jacobian(unknowns,segment,state,step=1e-30):
+    """ Jacobian by complex step, exact to round off
+
+        Inputs:
+            unknowns       - where the Jacobian is taken
+            segment.process.iterate
+            state          - copied, not changed
+            state.numerics.jacobian_sparsity - None, the sparsity detected for the
+                                               segment if there is one, otherwise
+                                               every residual may depend on every
+                                               unknown
+                                             - 'control_points' or boolean array,
+                                               see colored_finite_difference_jacobian
+
+        Outputs:
+            d(residuals)/d(unknowns)
+
+        Assumptions:
+            The iterate passes run on a copy of the state whose float arrays in
+            conditions, unknowns and residuals are made complex, so the steps
+            writing into slices of the conditions keep the imaginary part.
+            Unknowns that no residual depends on together are stepped in the
+            same pass, one pass per color of the sparsity, or per unknown
+            without one. If a step still drops the imaginary part, or does not
+            take complex numbers at all, this Jacobian is taken by finite
+            differences instead and state.numerics.jacobian is left as it is.
+    """
+
+    unknowns  = np.asarray(unknowns,dtype=float)
+    sparsity  = declared_sparsity(segment,state,len(unknowns))
+    if sparsity is None:
+        sparsity = np.ones((len(state.residuals.pack_array()),len(unknowns)),dtype=bool)
+    colors    = color_columns(sparsity)
+    work      = deepcopy(state)
+    J         = np.zeros(sparsity.shape)
+
+    for key in ['conditions','unknowns','residuals']:
+        if key in work:
+            make_complex(work[key])
+
+    try:
+        with warnings.catch_warnings():
+            # a step dropping the imaginary part would give a wrong column
+            warnings.simplefilter('error',np.ComplexWarning)
+
+            for color in range(np.max(colors)+1):
+                columns = np.where(colors == color)[0]
+                x = unknowns.astype(complex)
+                x[columns] += 1j*step
+                derivative = np.imag(iterate(x,segment,work))/step
+                for j in columns:
+                    rows = sparsity[:,j]
+                    J[rows,j] = derivative[rows]
+
+    except (np.ComplexWarning,TypeError):
+        warn('Segment ' + segment.tag + ' is not complex step safe, using finite differences',Warning)
+        return finite_difference_jacobian(unknowns,segment,state)
+
+    return J
+
+
+def finite_difference_jacobian(unknowns,segment,state):
+    """ Jacobian by forward differences, one iterate pass per unknown on a
+        copy of the state
+    """
+
+    unknowns  = np.asarray(unknowns,dtype=float)
+    work      = deepcopy(state)
+    residuals = iterate(unknowns,segment,work)
+    steps     = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+    columns   = []
+
+    for j in range(len(unknowns)):
+        x     = unknowns.copy()
+        x[j] += steps[j]
+        columns.append((iterate(x,segment,work) - residuals)/steps[j])
+
+    return np.array(columns).T
+
+
+def make_complex(conditions):
+    """ casts the float arrays of a conditions tree to complex, in place
+    """
+
+    for key, value in conditions.items():
+        if isinstance(value,dict):
+            make_complex(value)
+        elif isinstance(value,np.ndarray) and value.dtype.kind == 'f':
+            conditions[key] = value.astype(complex)
+
+    return
+
+
+def colored_finite_difference_jacobian(unknowns,segment,state):
+    """ Jacobian by forward differences, perturbing together the unknowns
+        that no residual depends on at the same time
+
+        Inputs:
+            state.numerics.jacobian_sparsity - None, detected from a full finite
+                                               difference Jacobian on the first call
+                                             - 'control_points', see
+                                               control_point_sparsity
+                                             - boolean array, residuals x unknowns
+            state.numerics.jacobian_sparsity_tolerance - entries below this fraction
+                                               of the largest in their row are
+                                               left out of a detected sparsity
+
+        Assumptions:
+            One iterate pass per color instead of one per unknown, the colors
+            are found greedily. Entries outside the sparsity, such as weak
+            couplings left out of a detected sparsity, are left out of the
+            Jacobian. fsolve still converges on the exact residuals and
+            corrects the Jacobian with its own updates. A detected sparsity is
+            kept on the segment as segment.detected_jacobian_sparsity, so later
+            evaluations of the segment reuse it while the number of unknowns
+            is the same.
+    """
+
+    unknowns = np.asarray(unknowns,dtype=float)
+    numerics = state.numerics
+    sparsity = declared_sparsity(segment,state,len(unknowns))
+
+    if sparsity is None:
+        J = finite_difference_jacobian(unknowns,segment,state)
+        row_max  = np.max(np.abs(J),axis=1)[:,None]
+        segment.detected_jacobian_sparsity = np.abs(J) > numerics.jacobian_sparsity_tolerance * row_max
+        return J
+
+    colors   = color_columns(sparsity)
+
+    work      = deepcopy(state)
+    residuals = iterate(unknowns,segment,work)
+    steps     = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+    J         = np.zeros(sparsity.shape)
+
+    for color in range(np.max(colors)+1):
+        columns = np.where(colors == color)[0]
+        x = unknowns.copy()
+        x[columns] += steps[columns]
+        difference = iterate(x,segment,work) - residuals
+        for j in columns:
+            rows = sparsity[:,j]
+            J[rows,j] = difference[rows]/steps[j]
+
+    return J
+
+
+def declared_sparsity(segment,state,n_unknowns):
+    """ residuals x unknowns sparsity from state.numerics.jacobian_sparsity,
+        or the one detected for the segment, None if there is neither for
+        this number of unknowns
+    """
+
+    sparsity    = state.numerics.get('jacobian_sparsity',None)
+    n_residuals = len(state.residuals.pack_array())
+
+    if isinstance(sparsity,str) and sparsity == 'control_points':
+        sparsity = control_point_sparsity(state)
+
+    elif sparsity is None:
+        sparsity = segment.get('detected_jacobian_sparsity',None)
+
+    if sparsity is None or np.shape(sparsity) != (n_residuals,n_unknowns):
+        return None
+
+    return np.asarray(sparsity,dtype=bool)
+
+
+def control_point_sparsity(state):
+    """ residuals x unknowns sparsity where the residuals at a control point
+        depend on the unknowns at that point, and on those at the points
+        coupled to it by the integration or differentiation matrix
+
+        Inputs:
+            state.numerics.number_control_points
+            state.numerics.dimensionless.integrate
+            state.numerics.dimensionless.differentiate
+            state.unknowns, state.residuals
+
+        Outputs:
+            boolean array, residuals x unknowns
+
+        Assumptions:
+            Unknowns and residuals that are not one row per control point are
+            coupled to everything. The Chebyshev matrices are full, so with
+            them every point is coupled to every other one and this sparsity
+            only separates the unknowns that are not per point. Leave
+            jacobian_sparsity as None to detect which couplings matter.
+    """
+
+    numerics = state.numerics
+    n_points = numerics.number_control_points
+    rows     = point_index(state.residuals,n_points).astype(int)
+    columns  = point_index(state.unknowns,n_points).astype(int)
+
+    coupled = np.eye(n_points,dtype=bool)
+    for key in ['integrate','differentiate']:
+        matrix = numerics.dimensionless.get(key,None)
+        if matrix is not None:
+            coupled = coupled | (np.abs(matrix) > 0.)
+
+    sparsity = coupled[rows[:,None],columns[None,:]]
+    sparsity[rows < 0,:]    = True
+    sparsity[:,columns < 0] = True
+
+    return sparsity
+
+
+def point_index(conditions,n_points):
+    """ control point of every entry of conditions.pack_array(), -1 for
+        entries that are not one row per control point
+    """
+
+    index = deepcopy(conditions)
+    for key, value in index.items():
+        value = np.asarray(value)
+        if value.ndim == 2 and value.shape[0] == n_points:
+            index[key] = np.arange(n_points)[:,None] * np.ones(value.shape)
+        else:
+            index[key] = -np.ones(value.shape)
+
+    return index.pack_array()
+
+
+def color_columns(sparsity):
+    """ greedy coloring of the columns of a boolean sparsity, two columns
+        share a color only if no row has an entry in both
+    """
+
+    n_columns = sparsity.shape[1]
+    colors    = -np.ones(n_columns,dtype=int)
+    used      = []
+
+    # densest columns first
+    for j in np.argsort(-np.sum(sparsity,axis=0),kind='mergesort'):
+        for color, rows in enumerate(used):
+            if not np.any(rows & sparsity[:,j]):
+                colors[j]    = color
+                used[color] |= sparsity[:,j]
+                break
+        else:
+            colors[j] = len(used)
+            used.append(sparsity[:,j].copy())
+
+    return colors
@@ -0,0 +1,36 @@
+# cache_folder.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+
+# ----------------------------------------------------------------------
+#  Cache Folder
+# ----------------------------------------------------------------------
+
+def cache_folder(name):
+    """ SUAVE.Methods.Utilities.cache_folder(name)
+        folder for the files SUAVE keeps between runs, outside the working
+        and source folders
+
+        Inputs:
+            name - subfolder, e.g. 'propeller_maps'
+
+        Outputs:
+            path of the folder, not created here
+
+        Assumptions:
+            The root is the SUAVE_CACHE environment variable, or .suave_cache
+            in the home folder.
+    """
+
+    root = os.environ.get('SUAVE_CACHE',None)
+    if not root:
+        root = os.path.join(os.path.expanduser('~'),'.suave_cache')
+
+    return os.path.join(root,name)
@@ -0,0 +1,111 @@
+# drag_polars.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Drag Polars
+# ----------------------------------------------------------------------
+
+def drag_polars(analyses,angle_of_attack,mach_number,altitude,filename=None):
+    """ SUAVE.Methods.Utilities.drag_polars(analyses,angle_of_attack,mach_number,altitude,filename=None)
+        lift and drag coefficients of every config on an angle of attack x
+        Mach number x altitude grid, one aerodynamics evaluation per config
+
+        Inputs:
+            analyses        - finalized analyses of the configs, as made by
+                              analyses_setup, each with an aerodynamics analysis
+                              and optionally an atmosphere
+            angle_of_attack - 1D array [radians]
+            mach_number     - 1D array
+            altitude        - 1D array [meters]
+            filename        - optional .npz file to save the polars to
+
+        Outputs:
+            polars.angle_of_attack, mach_number, altitude - the grid axes
+            polars[config tag].lift_coefficient
+            polars[config tag].drag_coefficient
+                arrays of shape (len(angle_of_attack),len(mach_number),len(altitude))
+
+            The .npz file holds the axes and <config tag>_lift_coefficient,
+            <config tag>_drag_coefficient, in float32.
+
+        Assumptions:
+            All the grid points are the rows of one state, evaluated at once.
+            Standard day freestream from the config atmosphere, US Standard 1976
+            if it has none. Configs without aerodynamics are skipped.
+    """
+
+    angle_of_attack = np.atleast_1d(angle_of_attack).astype(float)
+    mach_number     = np.atleast_1d(mach_number).astype(float)
+    altitude        = np.atleast_1d(altitude).astype(float)
+
+    shape       = (len(angle_of_attack),len(mach_number),len(altitude))
+    AoA, Mc, h  = np.meshgrid(angle_of_attack,mach_number,altitude,indexing='ij')
+    n_points    = AoA.size
+
+    polars = Data()
+    polars.angle_of_attack = angle_of_attack
+    polars.mach_number     = mach_number
+    polars.altitude        = altitude
+
+    arrays = Data()
+    arrays.angle_of_attack = angle_of_attack
+    arrays.mach_number     = mach_number
+    arrays.altitude        = altitude
+
+    for tag, config_analyses in analyses.items():
+
+        aerodynamics = config_analyses.get('aerodynamics',None)
+        if aerodynamics is None:
+            continue
+
+        atmosphere = config_analyses.get('atmosphere',None)
+        if atmosphere is None:
+            atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+        # one state with every grid point as a row
+        state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+        state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+        state.expand_rows(n_points)
+
+        freestream = state.conditions.freestream
+        atmo_data  = atmosphere.compute_values(h.reshape(-1,1))
+        ones       = np.ones((n_points,1))
+
+        freestream.altitude          = h.reshape(-1,1)
+        freestream.pressure          = atmo_data.pressure          * ones
+        freestream.temperature       = atmo_data.temperature       * ones
+        freestream.density           = atmo_data.density           * ones
+        freestream.speed_of_sound    = atmo_data.speed_of_sound    * ones
+        freestream.dynamic_viscosity = atmo_data.dynamic_viscosity * ones
+        freestream.mach_number       = Mc.reshape(-1,1)
+        freestream.velocity          = freestream.mach_number * freestream.speed_of_sound
+        freestream.reynolds_number   = freestream.density * freestream.velocity / freestream.dynamic_viscosity
+        freestream.dynamic_pressure  = 0.5 * freestream.density * freestream.velocity**2
+
+        state.conditions.aerodynamics.angle_of_attack = AoA.reshape(-1,1)
+
+        results = aerodynamics.evaluate(state)
+
+        polar = Data()
+        polar.lift_coefficient = np.reshape(results.lift.total,shape)
+        polar.drag_coefficient = np.reshape(results.drag.total,shape)
+        polars[tag] = polar
+
+        arrays[tag + '_lift_coefficient'] = polar.lift_coefficient.astype(np.float32)
+        arrays[tag + '_drag_coefficient'] = polar.drag_coefficient.astype(np.float32)
+
+    if filename is not None:
+        np.savez_compressed(filename,**arrays)
+
+    return polars
@@ -0,0 +1,53 @@
+# update_digest.py
+#
+# Created:  Oct 2026
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Update Digest
+# ----------------------------------------------------------------------
+
+def update_digest(sha,value,skipped_fields=()):
+    """ SUAVE.Methods.Utilities.update_digest(sha,value,skipped_fields=())
+        feeds the numbers, strings and flags in value to a hashlib object
+
+        Inputs:
+            sha            - hashlib object, e.g. hashlib.sha1()
+            value          - Data, dict, list, array or scalar, walked down to its leaves
+            skipped_fields - names of Data fields to leave out, at any depth
+
+        Outputs:
+            none, sha is updated
+
+        Assumptions:
+            Fields are visited in sorted order so equal Data give equal digests.
+            Numeric arrays are hashed as their float bytes and shape, anything
+            that is not a number, string, flag, array or Data is left out.
+    """
+
+    if isinstance(value,dict):
+        for name in sorted(value.keys()):
+            if name in skipped_fields:
+                continue
+            sha.update(str(name).encode('utf-8'))
+            update_digest(sha,value[name],skipped_fields)
+
+    elif isinstance(value,(list,tuple,np.ndarray)):
+        array = np.asarray(value)
+        if array.dtype.kind not in 'biuf':
+            for item in value:
+                update_digest(sha,item,skipped_fields)
+        else:
+            sha.update(str(array.shape).encode('utf-8'))
+            sha.update(np.ascontiguousarray(array,dtype=float).tobytes())
+
+    elif isinstance(value,(bool,int,float,str,np.number)) or value is None:
+        sha.update(repr(value).encode('utf-8'))
+
+    return